@@ -1,6 +1,6 @@
 """Chat streaming endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
@@ -10,17 +10,24 @@ from app.models import Session as SessionModel
 from app.models import User
 from app.schemas import ChatRequest
 from app.services.agent import run_agent_loop
+from app.utils.helpers import accepts_gzip, gzip_sse_stream
 
 router = APIRouter(prefix="/api/chat", tags=["Chat"])
 
 
 @router.post("/stream")
-async def chat_stream(request: ChatRequest, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def chat_stream(
+    request: ChatRequest,
+    http_request: Request,
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     """Stream chat responses over Server-Sent Events with optional tool calls.
 
     Args:
         request: Incoming chat payload containing message content, session ID,
             and optional tools/files.
+        http_request: Raw HTTP request, used to negotiate gzip for the stream.
         user: The authenticated user who owns the session.
         db: Database session injected by FastAPI.
 
@@ -55,19 +62,26 @@ async def chat_stream(request: ChatRequest, user: User = Depends(get_current_use
                 yield event
         except Exception as e:
             # Emit an error event.
-            import json
+            from app.utils.helpers import get_timestamp, sse_event
 
-            from app.utils.helpers import get_timestamp
+            yield sse_event(
+                {
+                    "type": "error",
+                    "error_code": "INTERNAL_ERROR",
+                    "error_message": str(e),
+                    "timestamp": get_timestamp(),
+                }
+            )
 
-            error_event = f"data: {json.dumps({'type': 'error', 'error_code': 'INTERNAL_ERROR', 'error_message': str(e), 'timestamp': get_timestamp()}, ensure_ascii=False)}\n\n"
-            yield error_event
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",  # Disable Nginx buffering.
+        "Vary": "Accept-Encoding",
+    }
+    stream = event_generator()
+    if accepts_gzip(http_request.headers.get("accept-encoding")):
+        stream = gzip_sse_stream(stream)
+        headers["Content-Encoding"] = "gzip"
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable Nginx buffering.
-        },
-    )
+    return StreamingResponse(stream, media_type="text/event-stream", headers=headers)
@@ -1,6 +1,5 @@
 """File management endpoints."""
 
-import base64
 from typing import List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, status
@@ -28,6 +27,7 @@ from app.services.file_handler import (
     validate_file_size,
     validate_mime_type,
 )
+from app.utils.helpers import encode_base64
 
 router = APIRouter(prefix="/api/files", tags=["File Management"])
 
@@ -284,7 +284,7 @@ def get_file_images(file_id: int, user: User = Depends(get_current_user), db: Se
     image_infos = []
     for img in images:
         # Embed base64 payloads for transport.
-        image_base64 = base64.b64encode(img.image_data).decode("utf-8")
+        image_base64 = encode_base64(img.image_data)
 
         image_infos.append(
             FileImageInfo(
@@ -355,7 +355,7 @@ def download_file(file_id: int, user: User = Depends(get_current_user), db: Sess
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
 
     return Response(
-        content=file.file_data,
+        content=file.content,
         media_type=file.mime_type,
         headers={"Content-Disposition": f"attachment; filename={file.filename}"},
     )
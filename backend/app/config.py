@@ -82,6 +82,9 @@ class Config:
             os.getenv("DDGS_CACHE_TTL_SECONDS", ddgs_data.get("cache_ttl_seconds", 60))
         )
         self.DDGS_CACHE_MAXSIZE: int = int(os.getenv("DDGS_CACHE_MAXSIZE", ddgs_data.get("cache_maxsize", 128)))
+        self.DDGS_MAX_PARALLEL_QUERIES: int = int(
+            os.getenv("DDGS_MAX_PARALLEL_QUERIES", ddgs_data.get("max_parallel_queries", 4))
+        )
 
         self.LLM_TEMPERATURE: float = float(os.getenv("LLM_TEMPERATURE", llm.get("temperature", 0.5)))
         self.LLM_TOP_P: float = float(os.getenv("LLM_TOP_P", llm.get("top_p", 1.0)))
@@ -137,6 +140,10 @@ class Config:
         self.PLAYWRIGHT_MAX_DOWNLOAD_SIZE_BYTES: int = int(
             playwright_settings.get("max_download_file_size_bytes", 30 * 1024 * 1024)
         )
+        self.PLAYWRIGHT_DOWNLOAD_CACHE_ENTRIES: int = int(playwright_settings.get("download_cache_entries", 8))
+        self.PLAYWRIGHT_DOWNLOAD_CACHE_MAX_BODY_BYTES: int = int(
+            playwright_settings.get("download_cache_max_body_bytes", 1024 * 1024)
+        )
 
     @staticmethod
     def _none_to_empty(value: Any) -> str:
@@ -82,6 +82,20 @@ class File(Base):
     user = relationship("User", back_populates="files")
     images = relationship("FileImage", back_populates="file", cascade="all, delete-orphan")
 
+    @property
+    def content(self) -> bytes:
+        """Return the original payload, falling back to the first page image.
+
+        Single-image files such as screenshots keep their bytes only on the
+        ``FileImage`` row and store an empty ``file_data``.
+        """
+        if self.file_data:
+            return self.file_data
+        for image in self.images:
+            if image.page_number == 1:
+                return image.image_data
+        return b""
+
 
 class FileImage(Base):
     """Derivative images produced from uploaded files."""
@@ -1,7 +1,6 @@
 """Core agent loop and persistence helpers."""
 
 import asyncio
-import base64
 import json
 import logging
 import time
@@ -14,11 +13,15 @@ from app.models import File, FileImage, Message
 from app.services.explore import LoopContext, run_explore_tool
 from app.services.llm import call_llm_with_tools
 from app.services.tools import execute_tool, get_available_tools
-from app.utils.helpers import get_timestamp, sse_event
+from app.utils.helpers import encode_base64, get_timestamp, sse_event, sse_events
 
 logger = logging.getLogger(__name__)
 
 ASSISTANT_ARTIFACT_TOOL_NAME = "__assistant_artifact__"
+# Blocking network/browser tools run in a worker thread so other sessions keep streaming meanwhile.
+THREADED_TOOL_NAMES = frozenset(
+    {"ddgs_search", "ai_search_web", "playwright_browse", "playwright_probe", "download_and_convert_file"}
+)
 
 
 class MultipleToolCallsError(Exception):
@@ -162,7 +165,7 @@ def build_message_content_with_files(user_message: str, file_ids: List[int], db:
         for img in file_images:
             content.append({"type": "text", "text": f"\n[File: {file.filename}, Page {img.page_number}]"})
 
-            image_base64 = base64.b64encode(img.image_data).decode("utf-8")
+            image_base64 = encode_base64(img.image_data)
             content.append(
                 {"type": "image_url", "image_url": {"url": f"data:image/webp;base64,{image_base64}", "detail": "high"}}
             )
@@ -194,7 +197,7 @@ def build_tool_file_message_content(file_id: int, header_text: str, db: Session)
 
     for image in file_images:
         content.append({"type": "text", "text": f"[File: {file.filename}, Page {image.page_number}]"})
-        image_base64 = base64.b64encode(image.image_data).decode("utf-8")
+        image_base64 = encode_base64(image.image_data)
         content.append(
             {
                 "type": "image_url",
@@ -269,6 +272,7 @@ def sanitize_tool_result_for_storage(tool_result: Dict[str, Any]) -> Dict[str, A
     """Return a shallow copy of the tool result without large inline payloads."""
     sanitized = {key: value for key, value in tool_result.items() if key != "image_blocks"}
     sanitized.pop("screenshot_base64", None)
+    sanitized.pop("screenshot_png", None)
 
     screenshot = sanitized.get("screenshot")
     if isinstance(screenshot, dict) and "image_blocks" in screenshot:
@@ -593,7 +597,7 @@ def build_system_prompt_with_current_time(enabled_tools: Optional[List[str]] = N
 
 async def run_agent_loop(
     session_id: int, user_message: str, model_id: str, files: Optional[List[int]], db: Session
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Run the main agent loop and stream SSE events.
 
     Args:
@@ -604,7 +608,7 @@ async def run_agent_loop(
         db: Database session used for reads and writes.
 
     Yields:
-        str: SSE-formatted messages conveying status updates and content.
+        bytes: SSE frames conveying status updates and content.
 
     Raises:
         MultipleToolCallsError: If the model attempts concurrent tool calls.
@@ -854,12 +858,14 @@ async def run_agent_loop(
                     pending_text_output += delta_text
 
                     segments_to_emit = collect_output_segments(current_guard)
+                    # Frames produced by one upstream chunk go out as a single write.
+                    chunk_events: List[Dict[str, Any]] = []
                     for segment in segments_to_emit:
                         if last_stream_guard_state != current_guard:
                             message = (
                                 "Sharing execution progress..." if current_guard else "Starting response generation..."
                             )
-                            yield sse_event(
+                            chunk_events.append(
                                 {
                                     "type": "content_start",
                                     "message": message,
@@ -874,7 +880,7 @@ async def run_agent_loop(
                         else:
                             full_content += segment
 
-                        yield sse_event(
+                        chunk_events.append(
                             {
                                 "type": "content_delta",
                                 "delta": segment,
@@ -882,6 +888,8 @@ async def run_agent_loop(
                                 "guarded": current_guard,
                             }
                         )
+                    if chunk_events:
+                        yield sse_events(chunk_events)
 
                 # Accumulate tool-call fragments.
                 if hasattr(delta, "tool_calls") and delta.tool_calls:
@@ -904,11 +912,12 @@ async def run_agent_loop(
 
         # Flush any remaining buffered text before evaluating finish_reason.
         pending_segments = collect_output_segments(ready_to_reply_guard, final=True)
+        pending_events: List[Dict[str, Any]] = []
         for segment in pending_segments:
             current_guard = ready_to_reply_guard
             if last_stream_guard_state != current_guard:
                 message = "Sharing execution progress..." if current_guard else "Starting response generation..."
-                yield sse_event(
+                pending_events.append(
                     {
                         "type": "content_start",
                         "message": message,
@@ -923,7 +932,7 @@ async def run_agent_loop(
             else:
                 full_content += segment
 
-            yield sse_event(
+            pending_events.append(
                 {
                     "type": "content_delta",
                     "delta": segment,
@@ -931,6 +940,8 @@ async def run_agent_loop(
                     "guarded": current_guard,
                 }
             )
+        if pending_events:
+            yield sse_events(pending_events)
 
         # Treat missing finish_reason as "stop" when we already have content but no tool calls.
         if finish_reason is None and not tool_calls_buffer and full_content.strip():
@@ -1021,7 +1032,7 @@ async def run_agent_loop(
             try:
                 if tool_name == "explore_tool":
                     tool_result = await run_explore_tool(model_id, tool_input, loop_ctx, history)
-                elif tool_name in {"playwright_browse", "playwright_probe", "download_and_convert_file"}:
+                elif tool_name in THREADED_TOOL_NAMES:
                     tool_result = await asyncio.to_thread(execute_tool, tool_name, tool_input, history, session_id)
                 else:
                     tool_result = execute_tool(tool_name, tool_input, history, session_id)
@@ -17,6 +17,9 @@ from app.config import config
 
 logger = logging.getLogger(__name__)
 
+# Context keys DDGSClient adds to every raw result item; consumers strip them before display.
+RESULT_ANNOTATION_KEYS = frozenset({"_rank", "_backend", "_category", "_region", "_query"})
+
 
 @dataclass(frozen=True)
 class SearchResult:
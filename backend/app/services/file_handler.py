@@ -4,11 +4,13 @@ import io
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from pdf2image import convert_from_bytes, convert_from_path
 from PIL import Image
+from PIL.Image import Image as PILImage
 
 from app.config import config
 
@@ -61,6 +63,36 @@ def compress_image(image_data: bytes, max_dimension: Optional[int] = None) -> Tu
         raise FileProcessingError(f"Image compression failed: {str(e)}") from e
 
 
+def _page_to_webp(img: PILImage, convert_rgb: bool) -> Tuple[bytes, int, int]:
+    """Downscale a rendered page to the configured bound and encode it as WebP."""
+    # Honor max dimensions.
+    if img.width > config.IMAGE_MAX_DIMENSION or img.height > config.IMAGE_MAX_DIMENSION:
+        ratio = min(config.IMAGE_MAX_DIMENSION / img.width, config.IMAGE_MAX_DIMENSION / img.height)
+        new_size = (int(img.width * ratio), int(img.height * ratio))
+        img = img.resize(new_size, Image.Resampling.LANCZOS)
+
+    if convert_rgb:
+        img = img.convert("RGB")
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="WEBP", quality=config.IMAGE_COMPRESSION_QUALITY)
+    return buffer.getvalue(), img.width, img.height
+
+
+def _encode_pages_as_webp(images: List[PILImage], *, convert_rgb: bool = False) -> List[Tuple[bytes, int, int]]:
+    """Encode rendered pages as WebP, in page order.
+
+    Pillow releases the GIL while resampling and encoding, so multi-page
+    documents are spread across a thread pool sized to the available CPUs.
+    """
+    max_workers = min(len(images), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return [_page_to_webp(img, convert_rgb) for img in images]
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="webp-encode") as executor:
+        return list(executor.map(_page_to_webp, images, [convert_rgb] * len(images)))
+
+
 def convert_docx_ppt_to_images(
     file_data: bytes, file_type: str, timeout: Optional[int] = None
 ) -> List[Tuple[bytes, int, int]]:
@@ -136,20 +168,7 @@ def convert_docx_ppt_to_images(
                 raise FileProcessingError(f"Failed to convert PDF to images: {str(e)}") from e
 
             # 4. Downscale each image if needed and encode as WebP.
-            webp_images = []
-            for img in images:
-                # Honor max dimensions.
-                if img.width > config.IMAGE_MAX_DIMENSION or img.height > config.IMAGE_MAX_DIMENSION:
-                    ratio = min(config.IMAGE_MAX_DIMENSION / img.width, config.IMAGE_MAX_DIMENSION / img.height)
-                    new_size = (int(img.width * ratio), int(img.height * ratio))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-
-                # Encode as WebP.
-                buffer = io.BytesIO()
-                img.save(buffer, format="WEBP", quality=config.IMAGE_COMPRESSION_QUALITY)
-                webp_images.append((buffer.getvalue(), img.width, img.height))
-
-            return webp_images
+            return _encode_pages_as_webp(images)
 
         except FileProcessingError:
             raise
@@ -174,19 +193,7 @@ def convert_pdf_to_images(pdf_data: bytes) -> List[Tuple[bytes, int, int]]:
     except Exception as e:  # pragma: no cover - pdf2image behaviour is environment-specific
         raise FileProcessingError(f"Failed to convert PDF to images: {str(e)}") from e
 
-    webp_images: List[Tuple[bytes, int, int]] = []
-    for img in images:
-        if img.width > config.IMAGE_MAX_DIMENSION or img.height > config.IMAGE_MAX_DIMENSION:
-            ratio = min(config.IMAGE_MAX_DIMENSION / img.width, config.IMAGE_MAX_DIMENSION / img.height)
-            new_size = (int(img.width * ratio), int(img.height * ratio))
-            img = img.resize(new_size, Image.Resampling.LANCZOS)
-
-        buffer = io.BytesIO()
-        img = img.convert("RGB")
-        img.save(buffer, format="WEBP", quality=config.IMAGE_COMPRESSION_QUALITY)
-        webp_images.append((buffer.getvalue(), img.width, img.height))
-
-    return webp_images
+    return _encode_pages_as_webp(images, convert_rgb=True)
 
 
 def get_file_type_from_mime(mime_type: str) -> str:
@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 import atexit
-import base64
+import hashlib
 import importlib
 import json
 import logging
 import os
+import re
 import subprocess
 import threading
 import time
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import suppress
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from playwright.sync_api import Browser, sync_playwright
+from playwright.sync_api import APIRequestContext, Browser, sync_playwright
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
@@ -28,7 +34,13 @@ SELECTOR_STATES = {"attached", "detached", "visible", "hidden"}
 _html_converter: Optional[Any] = None
 _html_converter_lock = threading.Lock()
 _html_converter_import_error: Optional[str] = None
+_MARKDOWN_CACHE_SIZE = 64
+_markdown_cache: OrderedDict[bytes, str] = OrderedDict()
+_markdown_cache_lock = threading.Lock()
 TRUNCATION_SUFFIX = "[...truncated...]"
+_NON_CONTENT_BLOCK_PATTERN = re.compile(r"<(script|style|svg)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+# Same boundaries as str.splitlines().
+_LINE_BREAK_PATTERN = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 
 
 class StrictModeViolation(RuntimeError):
@@ -76,16 +88,30 @@ def _get_html_converter() -> Optional[Any]:
     return _html_converter
 
 
+def _parse_int_text(value: str) -> Optional[int]:
+    """Parse an integer from text, accepting decimal notation as a fallback."""
+    text = value.strip()
+    if not text:
+        return None
+    try:
+        return int(text, 10)
+    except ValueError:
+        pass
+    try:
+        return int(float(text))
+    except (ValueError, OverflowError):
+        return None
+
+
 def _parse_positive_int(value: Any) -> Optional[int]:
     """Return a positive integer parsed from ``value`` or ``None`` if invalid."""
+    if isinstance(value, bool):
+        return None
     if isinstance(value, (int, float)) and value > 0:
         return int(value)
-    if isinstance(value, str) and value.strip():
-        try:
-            parsed = int(float(value))
-            return parsed if parsed > 0 else None
-        except ValueError:
-            return None
+    if isinstance(value, str):
+        parsed = _parse_int_text(value)
+        return parsed if parsed is not None and parsed > 0 else None
     return None
 
 
@@ -99,17 +125,122 @@ def _json_safe(value: Any) -> Any:
 
 
 def _parse_non_negative_int(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
     if isinstance(value, (int, float)) and value >= 0:
         return int(value)
-    if isinstance(value, str) and value.strip():
-        try:
-            parsed = int(float(value))
-            return parsed if parsed >= 0 else None
-        except ValueError:
-            return None
+    if isinstance(value, str):
+        parsed = _parse_int_text(value)
+        return parsed if parsed is not None and parsed >= 0 else None
     return None
 
 
+@lru_cache(maxsize=512)
+def _normalize_keyword_tuple(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Strip keywords and drop blanks; memoized because callers often repeat the same list."""
+    return tuple(stripped for stripped in (keyword.strip() for keyword in keywords) if stripped)
+
+
+def _convert_html_to_markdown(converter: Any, html: str, url: Optional[str]) -> str:
+    """Convert HTML to stripped Markdown, reusing results for identical HTML from the same URL."""
+    key = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest() + (url or "").encode()
+    with _markdown_cache_lock:
+        cached = _markdown_cache.get(key)
+        if cached is not None:
+            _markdown_cache.move_to_end(key)
+            return cached
+
+    markdown_text = converter.convert_string(html, url=url).markdown.strip()
+
+    with _markdown_cache_lock:
+        _markdown_cache[key] = markdown_text
+        _markdown_cache.move_to_end(key)
+        while len(_markdown_cache) > _MARKDOWN_CACHE_SIZE:
+            _markdown_cache.popitem(last=False)
+    return markdown_text
+
+
+def _iter_line_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of the lines ``str.splitlines()`` would produce, without the breaks."""
+    start = 0
+    for match in _LINE_BREAK_PATTERN.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    if start < len(text):
+        yield start, len(text)
+
+
+def _find_nth_delimiter(text: str, delimiter: str, occurrence: int) -> int:
+    """Return the offset of the ``occurrence``-th (1-based) non-overlapping ``delimiter`` in ``text``."""
+    position = -len(delimiter)
+    for _ in range(occurrence):
+        position = text.find(delimiter, position + len(delimiter))
+    return position
+
+
+@lru_cache(maxsize=256)
+def _compile_keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive alternation so each line is scanned in a single pass."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _normalize_page_range_value(raw_page_range: Any) -> Optional[Tuple[int, int]]:
+    """Parse a page range given as ``"2-4"``, ``"3"`` or a ``(start, end)`` tuple."""
+
+    def _validate_bounds(start: int, end: int) -> Tuple[int, int]:
+        if start < 1 or end < 1:
+            raise ValueError("page_range values must be positive integers.")
+        if end < start:
+            raise ValueError("page_range end must be greater than or equal to start.")
+        return start, end
+
+    if isinstance(raw_page_range, str):
+        text = raw_page_range.strip()
+        if not text:
+            return None
+        if "-" in text:
+            start_text, end_text = text.split("-", 1)
+            start = int(start_text.strip())
+            end = int(end_text.strip())
+        else:
+            start = end = int(text)
+        return _validate_bounds(start, end)
+
+    if isinstance(raw_page_range, tuple):
+        if len(raw_page_range) == 1:
+            value = int(raw_page_range[0])
+            return _validate_bounds(value, value)
+        if len(raw_page_range) >= 2:
+            start = int(raw_page_range[0])
+            end = int(raw_page_range[1])
+            return _validate_bounds(start, end)
+
+    raise ValueError("page_range must be a string like '2-4' or an array [start, end].")
+
+
+def _needs_post_processing(item: Dict[str, Any]) -> bool:
+    """Return whether an extraction result needs HTML conversion or keyword/page_range filtering."""
+    if "keywords" in item or "page_range" in item:
+        return True
+    return item.get("type") in {"html", "outer_html"} and isinstance(item.get("value"), str)
+
+
+# (etag, last_modified, body, headers) remembered for conditional revalidation.
+_CachedDownload = Tuple[Optional[str], Optional[str], bytes, Dict[str, str]]
+
+
+class _DownloadFlight:
+    """In-flight download shared by concurrent callers requesting the same URL."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Optional[Tuple[bytes, Dict[str, str]]] = None
+        self.error: Optional[BaseException] = None
+
+
 class PlaywrightManager:
     """Thread-safe wrapper around a single Playwright browser instance."""
 
@@ -118,7 +249,25 @@ class PlaywrightManager:
         self._lock = threading.Lock()
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self._request_context: Optional[APIRequestContext] = None
+        self._download_cache: OrderedDict[str, _CachedDownload] = OrderedDict()
         self._install_attempted = False
+        self._inflight_lock = threading.Lock()
+        self._inflight: Dict[str, _DownloadFlight] = {}
+        self._action_handlers: Dict[str, Callable[[Any, Dict[str, Any], int, List[str]], None]] = {
+            "click": self._action_click,
+            "fill": self._action_fill,
+            "wait_for_selector": self._action_wait_for_selector,
+            "wait_for_timeout": self._action_wait_for_timeout,
+        }
+        self._extraction_handlers: Dict[str, Callable[..., Any]] = {
+            "inner_text": self._extract_inner_text,
+            "all_inner_texts": self._extract_all_inner_texts,
+            "attribute": self._extract_attribute,
+            "html": self._extract_html,
+            "outer_html": self._extract_outer_html,
+            "count": self._extract_count,
+        }
         browsers_path = os.environ.setdefault("PLAYWRIGHT_BROWSERS_PATH", config.PLAYWRIGHT_BROWSERS_PATH)
         try:
             Path(browsers_path).mkdir(parents=True, exist_ok=True)
@@ -132,20 +281,15 @@ class PlaywrightManager:
             self._close_browser_unlocked()
 
     def _close_browser_unlocked(self) -> None:
-        if self._browser:
-            try:
-                self._browser.close()
-            except Exception:  # pragma: no cover - best effort cleanup
-                logger.debug("Failed to close Playwright browser", exc_info=True)
-            finally:
-                self._browser = None
-        if self._playwright:
-            try:
-                self._playwright.stop()
-            except Exception:  # pragma: no cover - best effort cleanup
-                logger.debug("Failed to stop Playwright runtime", exc_info=True)
-            finally:
-                self._playwright = None
+        self._dispose_request_context_unlocked()
+        browser, self._browser = self._browser, None
+        if browser:
+            with suppress(Exception):  # best effort cleanup
+                browser.close()
+        runtime, self._playwright = self._playwright, None
+        if runtime:
+            with suppress(Exception):  # best effort cleanup
+                runtime.stop()
 
     def _ensure_browser(self) -> None:
         if self._playwright and self._browser:
@@ -162,6 +306,20 @@ class PlaywrightManager:
                 raise
         self._browser = browser
 
+    def _get_request_context_unlocked(self) -> APIRequestContext:
+        """Return the shared API request context, creating it on first use so keep-alive connections are reused."""
+        if self._request_context is None:
+            playwright = self._playwright
+            assert playwright is not None
+            self._request_context = playwright.request.new_context()
+        return self._request_context
+
+    def _dispose_request_context_unlocked(self) -> None:
+        request_context, self._request_context = self._request_context, None
+        if request_context is not None:
+            with suppress(Exception):  # best effort cleanup
+                request_context.dispose()
+
     def _restart_browser(self) -> None:
         logger.warning("Restarting Playwright browser after failure")
         self._close_browser_unlocked()
@@ -209,6 +367,7 @@ class PlaywrightManager:
         )
 
         goto_timeout = _parse_positive_int(payload.get("timeout_ms")) or config.PLAYWRIGHT_NAVIGATION_TIMEOUT_MS
+        include_title = payload.get("include_title", True) is not False
         actions = payload.get("actions") if isinstance(payload.get("actions"), list) else []
         extracts = payload.get("extract") if isinstance(payload.get("extract"), list) else []
         screenshot_option = payload.get("screenshot")
@@ -289,14 +448,14 @@ class PlaywrightManager:
                 self._run_actions(page, actions, logs)
                 extraction_results = self._run_extractions(page, extracts, logs)
                 extraction_results = self._post_process_extractions(extraction_results, logs, page.url)
-                screenshot_meta, screenshot_base64 = self._capture_screenshot_if_requested(
-                    page, screenshot_option, logs
-                )
+                screenshot_meta, screenshot_png = self._capture_screenshot_if_requested(page, screenshot_option, logs)
 
-                try:
-                    title = page.title()
-                except PlaywrightError:
-                    title = ""
+                title: Optional[str] = None
+                if include_title:
+                    try:
+                        title = page.title()
+                    except PlaywrightError:
+                        title = ""
 
                 result: Dict[str, Any] = {
                     "success": True,
@@ -308,8 +467,8 @@ class PlaywrightManager:
                 }
                 if screenshot_meta:
                     result["screenshot"] = screenshot_meta
-                if screenshot_base64:
-                    result["screenshot_base64"] = screenshot_base64
+                if screenshot_png:
+                    result["screenshot_png"] = screenshot_png
                 return result
             except PlaywrightTimeoutError as exc:
                 logger.warning("Playwright operation timed out", exc_info=exc)
@@ -329,10 +488,8 @@ class PlaywrightManager:
                 return self._error("unexpected_error", str(exc), logs)
             finally:
                 if context is not None:
-                    try:
+                    with suppress(Exception):  # pragma: no cover - defensive
                         context.close()
-                    except Exception:  # pragma: no cover - defensive
-                        logger.debug("Failed to close Playwright context", exc_info=True)
 
     def probe_selectors(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Return match counts and sample snippets for selectors without extracting full content."""
@@ -360,6 +517,7 @@ class PlaywrightManager:
             )
 
         goto_timeout = _parse_positive_int(payload.get("timeout_ms")) or config.PLAYWRIGHT_NAVIGATION_TIMEOUT_MS
+        include_title = payload.get("include_title", True) is not False
 
         with self._lock:
             try:
@@ -390,10 +548,12 @@ class PlaywrightManager:
                     probe_result = self._probe_selector(page, selector)
                     probes.append({"selector": selector, "result": probe_result})
 
-                try:
-                    title = page.title()
-                except PlaywrightError:
-                    title = ""
+                title: Optional[str] = None
+                if include_title:
+                    try:
+                        title = page.title()
+                    except PlaywrightError:
+                        title = ""
 
                 return {
                     "success": True,
@@ -416,10 +576,8 @@ class PlaywrightManager:
                 return self._error("unexpected_error", str(exc), logs)
             finally:
                 if context is not None:
-                    try:
+                    with suppress(Exception):  # pragma: no cover - defensive
                         context.close()
-                    except Exception:  # pragma: no cover - defensive
-                        logger.debug("Failed to close Playwright context", exc_info=True)
 
     def _run_actions(self, page: Any, actions: List[Dict[str, Any]], logs: List[str]) -> None:
         """Execute user-specified actions sequentially."""
@@ -431,41 +589,47 @@ class PlaywrightManager:
                 raise ValueError(f"Action {idx} must be an object.")
 
             action_type = str(action.get("type", "")).strip().lower()
-            if action_type == "click":
-                selector = self._require_selector(action, context=f"action {idx}")
-                logs.append(f"Action {idx}: click {selector}")
-                locator = page.locator(selector)
-                click_kwargs: Dict[str, Any] = {}
-                button = str(action.get("button", "")).lower()
-                if button in {"left", "middle", "right"}:
-                    click_kwargs["button"] = button
-                click_count = _parse_positive_int(action.get("click_count"))
-                if click_count:
-                    click_kwargs["click_count"] = click_count
-                if action.get("force") is True:
-                    click_kwargs["force"] = True
-                locator.click(**click_kwargs)
-            elif action_type == "fill":
-                selector = self._require_selector(action, context=f"action {idx}")
-                if "value" not in action:
-                    raise ValueError(f"Action {idx} (fill) requires a 'value' field.")
-                value = action["value"]
-                logs.append(f"Action {idx}: fill {selector}")
-                page.fill(selector, "" if value is None else str(value))
-            elif action_type == "wait_for_selector":
-                selector = self._require_selector(action, context=f"action {idx}")
-                state = str(action.get("state", "")).strip().lower()
-                state_value = state if state in SELECTOR_STATES else None
-                logs.append(f"Action {idx}: wait_for_selector {selector} (state={state_value or 'visible'})")
-                page.wait_for_selector(selector, state=state_value)
-            elif action_type == "wait_for_timeout":
-                duration = _parse_positive_int(action.get("duration_ms"))
-                if duration is None:
-                    raise ValueError(f"Action {idx} (wait_for_timeout) requires numeric 'duration_ms'.")
-                logs.append(f"Action {idx}: wait_for_timeout {duration}ms")
-                page.wait_for_timeout(duration)
-            else:
+            handler = self._action_handlers.get(action_type)
+            if handler is None:
                 raise ValueError(f"Unsupported action type '{action_type}' for action {idx}.")
+            handler(page, action, idx, logs)
+
+    def _action_click(self, page: Any, action: Dict[str, Any], idx: int, logs: List[str]) -> None:
+        selector = self._require_selector(action, context=f"action {idx}")
+        logs.append(f"Action {idx}: click {selector}")
+        locator = page.locator(selector)
+        click_kwargs: Dict[str, Any] = {}
+        button = str(action.get("button", "")).lower()
+        if button in {"left", "middle", "right"}:
+            click_kwargs["button"] = button
+        click_count = _parse_positive_int(action.get("click_count"))
+        if click_count:
+            click_kwargs["click_count"] = click_count
+        if action.get("force") is True:
+            click_kwargs["force"] = True
+        locator.click(**click_kwargs)
+
+    def _action_fill(self, page: Any, action: Dict[str, Any], idx: int, logs: List[str]) -> None:
+        selector = self._require_selector(action, context=f"action {idx}")
+        if "value" not in action:
+            raise ValueError(f"Action {idx} (fill) requires a 'value' field.")
+        value = action["value"]
+        logs.append(f"Action {idx}: fill {selector}")
+        page.fill(selector, "" if value is None else str(value))
+
+    def _action_wait_for_selector(self, page: Any, action: Dict[str, Any], idx: int, logs: List[str]) -> None:
+        selector = self._require_selector(action, context=f"action {idx}")
+        state = str(action.get("state", "")).strip().lower()
+        state_value = state if state in SELECTOR_STATES else None
+        logs.append(f"Action {idx}: wait_for_selector {selector} (state={state_value or 'visible'})")
+        page.wait_for_selector(selector, state=state_value)
+
+    def _action_wait_for_timeout(self, page: Any, action: Dict[str, Any], idx: int, logs: List[str]) -> None:
+        duration = _parse_positive_int(action.get("duration_ms"))
+        if duration is None:
+            raise ValueError(f"Action {idx} (wait_for_timeout) requires numeric 'duration_ms'.")
+        logs.append(f"Action {idx}: wait_for_timeout {duration}ms")
+        page.wait_for_timeout(duration)
 
     def _select_target_locator(self, locator: Any, *, pick_first: bool, index: Optional[int]) -> Any:
         if index is not None:
@@ -538,53 +702,10 @@ class PlaywrightManager:
                 pick_first = bool(extraction.get("pick_first", False))
                 index_value = _parse_non_negative_int(extraction.get("index"))
 
-                if extraction_type == "inner_text":
-                    logs.append(f"Extraction {idx}: inner_text of {selector}")
-                    target = self._select_target_locator(locator, pick_first=pick_first, index=index_value)
-                    try:
-                        value = target.inner_text()
-                    except PlaywrightError as exc:
-                        if "strict mode violation" in str(exc).lower() and not pick_first and index_value is None:
-                            raise StrictModeViolation(selector, str(exc)) from exc
-                        raise
-                elif extraction_type == "all_inner_texts":
-                    logs.append(f"Extraction {idx}: all_inner_texts of {selector}")
-                    value = locator.all_inner_texts()
-                elif extraction_type == "attribute":
-                    attribute_name = extraction.get("attribute")
-                    if not isinstance(attribute_name, str) or not attribute_name.strip():
-                        raise ValueError(f"Extraction {idx} (attribute) requires 'attribute'.")
-                    logs.append(f"Extraction {idx}: attribute '{attribute_name}' of {selector}")
-                    target = self._select_target_locator(locator, pick_first=pick_first, index=index_value)
-                    try:
-                        value = target.get_attribute(attribute_name)
-                    except PlaywrightError as exc:
-                        if "strict mode violation" in str(exc).lower() and not pick_first and index_value is None:
-                            raise StrictModeViolation(selector, str(exc)) from exc
-                        raise
-                elif extraction_type == "html":
-                    logs.append(f"Extraction {idx}: inner_html of {selector}")
-                    target = self._select_target_locator(locator, pick_first=pick_first, index=index_value)
-                    try:
-                        value = target.inner_html()
-                    except PlaywrightError as exc:
-                        if "strict mode violation" in str(exc).lower() and not pick_first and index_value is None:
-                            raise StrictModeViolation(selector, str(exc)) from exc
-                        raise
-                elif extraction_type == "outer_html":
-                    logs.append(f"Extraction {idx}: outer_html of {selector}")
-                    target = self._select_target_locator(locator, pick_first=pick_first, index=index_value)
-                    try:
-                        value = target.evaluate("element => element.outerHTML")
-                    except PlaywrightError as exc:
-                        if "strict mode violation" in str(exc).lower() and not pick_first and index_value is None:
-                            raise StrictModeViolation(selector, str(exc)) from exc
-                        raise
-                elif extraction_type == "count":
-                    logs.append(f"Extraction {idx}: count of {selector}")
-                    value = locator.count()
-                else:
+                handler = self._extraction_handlers.get(extraction_type)
+                if handler is None:
                     raise ValueError(f"Unsupported extraction type '{extraction_type}' for extraction {idx}.")
+                value = handler(locator, extraction, selector, idx, logs, pick_first, index_value)
 
                 entry["value"] = _json_safe(value)
                 metadata["status"] = "ok" if not self._is_empty_extraction_result(extraction_type, value) else "empty"
@@ -597,6 +718,108 @@ class PlaywrightManager:
 
         return results
 
+    def _read_target(
+        self,
+        locator: Any,
+        selector: str,
+        pick_first: bool,
+        index: Optional[int],
+        read: Callable[[Any], Any],
+    ) -> Any:
+        """Read from the targeted locator, surfacing strict-mode violations with guidance."""
+        target = self._select_target_locator(locator, pick_first=pick_first, index=index)
+        try:
+            return read(target)
+        except PlaywrightError as exc:
+            if "strict mode violation" in str(exc).lower() and not pick_first and index is None:
+                raise StrictModeViolation(selector, str(exc)) from exc
+            raise
+
+    def _extract_inner_text(
+        self,
+        locator: Any,
+        extraction: Dict[str, Any],
+        selector: str,
+        idx: int,
+        logs: List[str],
+        pick_first: bool,
+        index: Optional[int],
+    ) -> Any:
+        logs.append(f"Extraction {idx}: inner_text of {selector}")
+        return self._read_target(locator, selector, pick_first, index, lambda target: target.inner_text())
+
+    def _extract_all_inner_texts(
+        self,
+        locator: Any,
+        extraction: Dict[str, Any],
+        selector: str,
+        idx: int,
+        logs: List[str],
+        pick_first: bool,
+        index: Optional[int],
+    ) -> Any:
+        logs.append(f"Extraction {idx}: all_inner_texts of {selector}")
+        return locator.all_inner_texts()
+
+    def _extract_attribute(
+        self,
+        locator: Any,
+        extraction: Dict[str, Any],
+        selector: str,
+        idx: int,
+        logs: List[str],
+        pick_first: bool,
+        index: Optional[int],
+    ) -> Any:
+        attribute_name = extraction.get("attribute")
+        if not isinstance(attribute_name, str) or not attribute_name.strip():
+            raise ValueError(f"Extraction {idx} (attribute) requires 'attribute'.")
+        logs.append(f"Extraction {idx}: attribute '{attribute_name}' of {selector}")
+        return self._read_target(
+            locator, selector, pick_first, index, lambda target: target.get_attribute(attribute_name)
+        )
+
+    def _extract_html(
+        self,
+        locator: Any,
+        extraction: Dict[str, Any],
+        selector: str,
+        idx: int,
+        logs: List[str],
+        pick_first: bool,
+        index: Optional[int],
+    ) -> Any:
+        logs.append(f"Extraction {idx}: inner_html of {selector}")
+        return self._read_target(locator, selector, pick_first, index, lambda target: target.inner_html())
+
+    def _extract_outer_html(
+        self,
+        locator: Any,
+        extraction: Dict[str, Any],
+        selector: str,
+        idx: int,
+        logs: List[str],
+        pick_first: bool,
+        index: Optional[int],
+    ) -> Any:
+        logs.append(f"Extraction {idx}: outer_html of {selector}")
+        return self._read_target(
+            locator, selector, pick_first, index, lambda target: target.evaluate("element => element.outerHTML")
+        )
+
+    def _extract_count(
+        self,
+        locator: Any,
+        extraction: Dict[str, Any],
+        selector: str,
+        idx: int,
+        logs: List[str],
+        pick_first: bool,
+        index: Optional[int],
+    ) -> Any:
+        logs.append(f"Extraction {idx}: count of {selector}")
+        return locator.count()
+
     def _probe_selector(self, page: Any, selector: str, sample_size: int = 3) -> Dict[str, Any]:
         try:
             probe = page.evaluate(
@@ -655,19 +878,65 @@ class PlaywrightManager:
         return False
 
     def download_file(self, url: str, timeout: Optional[int] = None) -> tuple[bytes, Dict[str, str]]:
-        """Download raw bytes for a remote resource via Playwright."""
+        """Download raw bytes for a remote resource via Playwright.
+
+        Concurrent calls for the same URL share a single upstream fetch.
+        """
+        with self._inflight_lock:
+            flight = self._inflight.get(url)
+            leader = flight is None
+            if leader:
+                flight = _DownloadFlight()
+                self._inflight[url] = flight
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.result is not None
+            data, headers = flight.result
+            return data, dict(headers)
+
+        try:
+            flight.result = self._download_file(url, timeout)
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(url, None)
+            flight.event.set()
+
+    def _download_file(self, url: str, timeout: Optional[int]) -> tuple[bytes, Dict[str, str]]:
         with self._lock:
             self._ensure_browser()
-            playwright = self._playwright
-            assert playwright is not None
-            request_context = playwright.request.new_context()
+            request_context = self._get_request_context_unlocked()
+            cached = self._download_cache.get(url)
+            request_headers: Dict[str, str] = {}
+            if cached is not None:
+                etag, last_modified, _, _ = cached
+                if etag:
+                    request_headers["If-None-Match"] = etag
+                if last_modified:
+                    request_headers["If-Modified-Since"] = last_modified
             try:
-                response = request_context.get(url, timeout=timeout or config.PLAYWRIGHT_NAVIGATION_TIMEOUT_MS)
+                response = request_context.get(
+                    url,
+                    headers=request_headers or None,
+                    timeout=timeout or config.PLAYWRIGHT_NAVIGATION_TIMEOUT_MS,
+                )
             except PlaywrightError:
-                request_context.dispose()
+                # Drop the shared context so a broken connection pool is not reused.
+                self._dispose_request_context_unlocked()
                 raise
 
             try:
+                if response.status == 304 and cached is not None:
+                    logger.debug("Download cache revalidated for %s", url)
+                    self._download_cache.move_to_end(url)
+                    return cached[2], dict(cached[3])
+
                 if not response.ok:
                     status = response.status
                     body_preview = response.text()[:200]
@@ -675,9 +944,27 @@ class PlaywrightManager:
 
                 data = response.body()
                 headers = response.headers
+                self._store_download_unlocked(url, data, headers)
                 return data, headers
             finally:
-                request_context.dispose()
+                with suppress(Exception):
+                    response.dispose()
+
+    def _store_download_unlocked(self, url: str, data: bytes, headers: Dict[str, str]) -> None:
+        """Remember a response for conditional revalidation when the server provides validators."""
+        max_entries = config.PLAYWRIGHT_DOWNLOAD_CACHE_ENTRIES
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if max_entries <= 0 or len(data) > config.PLAYWRIGHT_DOWNLOAD_CACHE_MAX_BODY_BYTES:
+            self._download_cache.pop(url, None)
+            return
+        if not etag and not last_modified:
+            self._download_cache.pop(url, None)
+            return
+        self._download_cache[url] = (etag, last_modified, data, dict(headers))
+        self._download_cache.move_to_end(url)
+        while len(self._download_cache) > max_entries:
+            self._download_cache.popitem(last=False)
 
     def _post_process_extractions(
         self,
@@ -685,18 +972,29 @@ class PlaywrightManager:
         logs: List[str],
         page_url: Optional[str],
     ) -> List[Dict[str, Any]]:
-        """Convert large HTML payloads to Markdown, apply filters, and enforce length limits."""
+        """Convert large HTML payloads to Markdown, apply filters, and enforce length limits.
+
+        The result dicts produced by ``_run_extractions`` are updated in place rather than copied.
+        """
+        max_extraction_chars = max(config.PLAYWRIGHT_MAX_EXTRACTION_CHARS, 0)
+        if not max_extraction_chars and not any(_needs_post_processing(item) for item in extracts):
+            # Nothing to convert, filter or trim: only normalise the metadata flag the full path would add.
+            for item in extracts:
+                metadata = item.get("metadata")
+                if metadata:
+                    metadata.setdefault("truncated", False)
+            return extracts
+
         processed: List[Dict[str, Any]] = []
         converter = _get_html_converter()
         max_html = max(config.PLAYWRIGHT_MAX_HTML_CHARS, 0)
         max_markdown = max(config.PLAYWRIGHT_MAX_MARKDOWN_CHARS, 0)
-        max_extraction_chars = max(config.PLAYWRIGHT_MAX_EXTRACTION_CHARS, 0)
 
         for idx, item in enumerate(extracts, start=1):
-            entry = dict(item)
+            entry = item
             extraction_type = entry.get("type")
             value = entry.get("value")
-            metadata = dict(entry.pop("metadata", {}) or {})
+            metadata = entry.pop("metadata", None) or {}
 
             if isinstance(value, str) and extraction_type in {"html", "outer_html"}:
                 raw_html_length = len(value)
@@ -715,9 +1013,12 @@ class PlaywrightManager:
                 markdown_truncated = False
 
                 if converter is not None:
+                    converter_input = html_for_conversion
+                    if max_markdown and len(converter_input) > max_markdown * 4:
+                        # Script/style/svg bodies yield no Markdown; drop them so the converter parses less.
+                        converter_input = _NON_CONTENT_BLOCK_PATTERN.sub("", converter_input)
                     try:
-                        markdown_result = converter.convert_string(html_for_conversion, url=page_url)
-                        markdown_text = markdown_result.markdown.strip()
+                        markdown_text = _convert_html_to_markdown(converter, converter_input, page_url)
                         conversion_successful = True
                     except Exception as exc:  # pragma: no cover - defensive
                         logger.warning("MarkItDown conversion failed", exc_info=exc)
@@ -748,8 +1049,14 @@ class PlaywrightManager:
             page_range = entry.pop("page_range", None)
             filters_metadata: Dict[str, Any] = {}
 
+            # With both filters on text, keep the keyword matches as a line list so the page range slices it directly
+            # instead of re-splitting the joined string.
+            lines_mode = bool(keywords) and bool(page_range) and isinstance(entry.get("value"), str)
+
             if keywords:
-                filtered_value, keyword_meta = self._filter_by_keywords(entry.get("value"), keywords)
+                filtered_value, keyword_meta = self._filter_by_keywords(
+                    entry.get("value"), keywords, as_lines=lines_mode
+                )
                 filters_metadata["keywords"] = keyword_meta
                 entry["value"] = filtered_value
                 if keyword_meta.get("removed_all"):
@@ -759,6 +1066,8 @@ class PlaywrightManager:
 
             if page_range:
                 filtered_value, page_meta = self._filter_by_page_range(entry.get("value"), page_range)
+                if lines_mode:
+                    filtered_value = "\n".join(filtered_value)
                 filters_metadata["page_range"] = page_meta
                 entry["value"] = filtered_value
                 if page_meta.get("removed_all"):
@@ -800,8 +1109,8 @@ class PlaywrightManager:
 
     def _capture_screenshot_if_requested(
         self, page: Any, screenshot_option: Any, logs: List[str]
-    ) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
-        """Capture a screenshot when the caller opts in."""
+    ) -> tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """Capture a screenshot when the caller opts in and return its raw PNG bytes."""
         if not screenshot_option:
             return None, None
 
@@ -833,59 +1142,32 @@ class PlaywrightManager:
         if selector:
             metadata["selector"] = selector
 
-        encoded_png = base64.b64encode(png_bytes).decode("utf-8")
-
-        return metadata, encoded_png
+        return metadata, png_bytes
 
     def _normalize_keywords(self, raw_keywords: Any) -> List[str]:
         if raw_keywords is None:
             return []
         if not isinstance(raw_keywords, list):
             raise ValueError("keywords must be an array of strings.")
-        cleaned: List[str] = []
-        for keyword in raw_keywords:
-            if not isinstance(keyword, str):
-                raise ValueError("keywords array must contain only strings.")
-            stripped = keyword.strip()
-            if stripped:
-                cleaned.append(stripped)
-        return cleaned
+        if not all(isinstance(keyword, str) for keyword in raw_keywords):
+            raise ValueError("keywords array must contain only strings.")
+        return list(_normalize_keyword_tuple(tuple(raw_keywords)))
 
     def _normalize_page_range(self, raw_page_range: Any) -> Optional[Tuple[int, int]]:
         if raw_page_range in (None, "", []):
             return None
-
-        def _validate_bounds(start: int, end: int) -> Tuple[int, int]:
-            if start < 1 or end < 1:
-                raise ValueError("page_range values must be positive integers.")
-            if end < start:
-                raise ValueError("page_range end must be greater than or equal to start.")
-            return start, end
-
-        if isinstance(raw_page_range, str):
-            text = raw_page_range.strip()
-            if not text:
-                return None
-            if "-" in text:
-                start_text, end_text = text.split("-", 1)
-                start = int(start_text.strip())
-                end = int(end_text.strip())
-            else:
-                start = end = int(text)
-            return _validate_bounds(start, end)
-
-        if isinstance(raw_page_range, (list, tuple)):
-            if len(raw_page_range) == 1:
-                value = int(raw_page_range[0])
-                return _validate_bounds(value, value)
-            if len(raw_page_range) >= 2:
-                start = int(raw_page_range[0])
-                end = int(raw_page_range[1])
-                return _validate_bounds(start, end)
-
-        raise ValueError("page_range must be a string like '2-4' or an array [start, end].")
-
-    def _filter_by_keywords(self, value: Any, keywords: List[str]) -> Tuple[Any, Dict[str, Any]]:
+        if isinstance(raw_page_range, list):
+            raw_page_range = tuple(raw_page_range)
+        try:
+            hash(raw_page_range)
+        except TypeError:
+            # Unhashable input (e.g. a nested list or a dict) cannot be a cache key; parse it uncached.
+            return _normalize_page_range_value.__wrapped__(raw_page_range)
+        return _normalize_page_range_value(raw_page_range)
+
+    def _filter_by_keywords(
+        self, value: Any, keywords: List[str], *, as_lines: bool = False
+    ) -> Tuple[Any, Dict[str, Any]]:
         meta: Dict[str, Any] = {
             "applied": False,
             "matched_segments": 0,
@@ -895,23 +1177,28 @@ class PlaywrightManager:
         if not keywords:
             return value, meta
 
-        lowered_keywords = [kw.lower() for kw in keywords]
+        pattern = _compile_keyword_pattern(tuple(keywords))
         meta["applied"] = True
 
         if isinstance(value, str):
-            lines = value.splitlines()
-            kept_lines = [line for line in lines if any(kw in line.lower() for kw in lowered_keywords)]
+            if pattern.search(value) is None:
+                meta["removed_all"] = True
+                return ([] if as_lines else ""), meta
+            # Search bounded spans in place and slice only the kept lines.
+            kept_lines = [
+                value[start:end] for start, end in _iter_line_spans(value) if pattern.search(value, start, end)
+            ]
             meta["matched_segments"] = len(kept_lines)
-            if kept_lines:
-                return "\n".join(kept_lines), meta
-            meta["removed_all"] = True
-            return "", meta
+            if not kept_lines:
+                meta["removed_all"] = True
+            if as_lines:
+                return kept_lines, meta
+            return "\n".join(kept_lines), meta
 
         if isinstance(value, list):
             kept_items = []
             for item in value:
-                text = str(item)
-                if any(kw in text.lower() for kw in lowered_keywords):
+                if pattern.search(item if isinstance(item, str) else str(item)):
                     kept_items.append(item)
             meta["matched_segments"] = len(kept_items)
             if kept_items:
@@ -950,24 +1237,35 @@ class PlaywrightManager:
         if isinstance(value, str):
             if not value:
                 return value, meta
-            if "\n\n" in value:
-                segments = value.split("\n\n")
-                joiner = "\n\n"
-            else:
-                segments = value.splitlines()
-                joiner = "\n"
-            total = len(segments)
+            start_idx = max(start - 1, 0)
+            paragraph_breaks = value.count("\n\n")
+            if paragraph_breaks:
+                # Locate only the delimiters bounding the range and return a single slice.
+                total = paragraph_breaks + 1
+                meta["total_segments"] = total
+                end_idx = min(end, total)
+                if start_idx >= end_idx:
+                    meta["removed_all"] = True
+                    return "", meta
+                meta["kept_segments"] = end_idx - start_idx
+                begin = _find_nth_delimiter(value, "\n\n", start_idx) + 2 if start_idx else 0
+                finish = _find_nth_delimiter(value, "\n\n", end_idx) if end_idx < total else len(value)
+                return value[begin:finish], meta
+
+            kept_lines: List[str] = []
+            total = 0
+            for start_offset, end_offset in _iter_line_spans(value):
+                if start_idx <= total < end:
+                    kept_lines.append(value[start_offset:end_offset])
+                total += 1
             meta["total_segments"] = total
             if total == 0:
                 return value, meta
-            start_idx = max(start - 1, 0)
-            end_idx = min(end, total)
-            filtered_segments = segments[start_idx:end_idx]
-            meta["kept_segments"] = len(filtered_segments)
-            if not filtered_segments:
+            meta["kept_segments"] = len(kept_lines)
+            if not kept_lines:
                 meta["removed_all"] = True
                 return "", meta
-            return joiner.join(filtered_segments), meta
+            return "\n".join(kept_lines), meta
 
         meta["applied"] = False
         meta["reason"] = "unsupported_type"
@@ -1001,34 +1299,34 @@ class PlaywrightManager:
             return truncated_text, meta
 
         if isinstance(value, list):
-            text_lengths = [len(str(item)) for item in value]
-            original_length = sum(text_lengths)
+            cumulative_lengths = list(
+                accumulate(len(item) if isinstance(item, str) else len(str(item)) for item in value)
+            )
+            original_length = cumulative_lengths[-1] if cumulative_lengths else 0
             meta["original_length"] = original_length
             if original_length <= limit:
                 meta["kept_length"] = original_length
                 return value, meta
 
-            remaining = limit
-            truncated_items: List[Any] = []
-            for item, item_length in zip(value, text_lengths, strict=False):
-                if remaining <= 0:
-                    break
-                if item_length <= remaining:
-                    truncated_items.append(item)
-                    remaining -= item_length
-                    continue
+            # Whole items are kept while the running total stays within the limit; stop right after it is reached.
+            cutoff = bisect_left(cumulative_lengths, limit)
+            if cumulative_lengths[cutoff] == limit:
+                cutoff += 1
+            truncated_items: List[Any] = list(value[:cutoff])
+            kept_length = cumulative_lengths[cutoff - 1] if cutoff else 0
+            remaining = limit - kept_length
+            if remaining > 0:
                 slice_length = max(remaining - len(TRUNCATION_SUFFIX), 0)
-                truncated_item = str(item)[:slice_length].rstrip()
+                truncated_item = str(value[cutoff])[:slice_length].rstrip()
                 if slice_length > 0:
                     truncated_item = f"{truncated_item}{TRUNCATION_SUFFIX}"
                 else:
                     truncated_item = TRUNCATION_SUFFIX
                 truncated_items.append(truncated_item)
-                remaining = 0
-                break
+                kept_length += len(truncated_item)
 
             meta["truncated"] = True
-            meta["kept_length"] = sum(len(str(item)) for item in truncated_items)
+            meta["kept_length"] = kept_length
             return truncated_items, meta
 
         return value, meta
@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
-import copy
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+import itertools
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+
+def _clone_json(value: Any) -> Any:
+    """Copy the dict/list nodes of a JSON-like structure, sharing immutable leaves."""
+    if isinstance(value, dict):
+        return {key: _clone_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_json(item) for item in value]
+    return value
 
 
 class ToolRegistry:
@@ -14,27 +23,35 @@ class ToolRegistry:
         self._tools: List[Dict[str, Any]] = list(tools)
         self._internal_tools: List[Dict[str, Any]] = list(internal_tools)
         self._tool_lookup: Dict[str, Dict[str, Any]] = {tool["function"]["name"]: tool for tool in self._tools}
-        self._optional_tool_names: Set[str] = {
+        self._optional_tool_names: FrozenSet[str] = frozenset(
             name
             for name, tool in self._tool_lookup.items()
             if tool.get("tier") in {"extra", "mcp"} and tool.get("enablement", True)
+        )
+        self._by_tier: Dict[Any, List[Tuple[int, Dict[str, Any]]]] = {}
+        for position, tool in enumerate(self._tools):
+            if tool.get("enablement", True):
+                self._by_tier.setdefault(tool.get("tier"), []).append((position, tool))
+        # Definitions are treated as immutable after construction, so strip metadata once up front.
+        self._stripped: Dict[int, Dict[str, Any]] = {
+            id(tool): self._strip_metadata(tool) for tool in (*self._tools, *self._internal_tools)
         }
 
     @staticmethod
     def _strip_metadata(tool: Dict[str, Any]) -> Dict[str, Any]:
-        stripped = copy.deepcopy(tool)
+        stripped = _clone_json(tool)
         stripped.pop("tier", None)
         stripped.pop("tags", None)
         stripped.pop("enablement", None)
         return stripped
 
+    def _stripped_copy(self, tool: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a top-level copy of the precomputed stripped definition."""
+        return dict(self._stripped[id(tool)])
+
     def core(self) -> List[Dict[str, Any]]:
         """Return all core tools with metadata removed."""
-        return [
-            self._strip_metadata(tool)
-            for tool in self._tools
-            if tool.get("tier") == "core" and tool.get("enablement", True)
-        ]
+        return [self._stripped_copy(tool) for _, tool in self._by_tier.get("core", ())]
 
     def for_session(self, transient_enabled: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """Return tools visible during a run, including transient extras."""
@@ -51,22 +68,26 @@ class ToolRegistry:
                 and tool.get("tier") in {"extra", "mcp"}
                 and name not in existing_names
             ):
-                visible.append(self._strip_metadata(tool))
+                visible.append(self._stripped_copy(tool))
                 existing_names.add(name)
         return visible
 
     def internal_tools(self) -> List[Dict[str, Any]]:
         """Return internal-only tool definitions (metadata stripped)."""
-        return [self._strip_metadata(tool) for tool in self._internal_tools]
+        return [self._stripped_copy(tool) for tool in self._internal_tools]
 
     def get_tools_by_tier(self, tiers: Iterable[str], *, strip_meta: bool = True) -> List[Dict[str, Any]]:
         """Return tools filtered by tier."""
-        tier_set = set(tiers)
-        selected = [tool for tool in self._tools if tool.get("tier") in tier_set and tool.get("enablement", True)]
+        buckets = [self._by_tier[tier] for tier in set(tiers) if tier in self._by_tier]
+        if len(buckets) == 1:
+            selected = [tool for _, tool in buckets[0]]
+        else:
+            # Merge buckets back into definition order so the result does not depend on set iteration order.
+            selected = [tool for _, tool in sorted(itertools.chain.from_iterable(buckets), key=lambda pair: pair[0])]
         if strip_meta:
-            return [self._strip_metadata(tool) for tool in selected]
-        return [copy.deepcopy(tool) for tool in selected]
+            return [self._stripped_copy(tool) for tool in selected]
+        return [_clone_json(tool) for tool in selected]
 
-    def optional_tool_names(self) -> Set[str]:
+    def optional_tool_names(self) -> FrozenSet[str]:
         """Return names of tools that are not part of the core tier."""
-        return set(self._optional_tool_names)
+        return self._optional_tool_names
@@ -1,22 +1,28 @@
 """Tool definitions and execution helpers."""
 
-import base64
 import io
 import logging
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, TypeVar
 from urllib.parse import unquote, urlparse
 from zoneinfo import ZoneInfo
 
 from playwright.sync_api import Error as PlaywrightError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from app.config import config
 from app.database import SessionLocal
 from app.models import File, FileImage
 from app.models import Session as SessionModel
-from app.services.ddgs_client import DDGSSearchError, get_ddgs_client
+from app.services.ddgs_client import RESULT_ANNOTATION_KEYS, DDGSSearchError, SearchResult, get_ddgs_client
 from app.services.file_handler import (
     FileProcessingError,
     compress_image,
@@ -25,78 +31,181 @@ from app.services.file_handler import (
 )
 from app.services.playwright_client import playwright_manager
 from app.services.tool_registry import ToolRegistry
+from app.utils.helpers import encode_base64
 
 logger = logging.getLogger(__name__)
 
-VALID_CATEGORIES = {"text", "images", "news", "videos", "books"}
-SAFESEARCH_LEVELS = {"on", "moderate", "off"}
-TIMELIMIT_VALUES = {"d", "w", "m", "y"}
-LANG_TO_REGION = {
-    "en": "us-en",
-    "en-us": "us-en",
-    "en-gb": "uk-en",
-    "zh": "cn-zh",
-    "zh-cn": "cn-zh",
-    "zh-tw": "tw-tzh",
-    "zh-hk": "hk-tzh",
-    "es": "es-es",
-    "es-mx": "mx-es",
-    "fr": "fr-fr",
-    "de": "de-de",
-    "it": "it-it",
-    "ja": "jp-jp",
-    "ko": "kr-kr",
-    "pt": "pt-pt",
-    "pt-br": "br-pt",
-    "ru": "ru-ru",
-    "ar": "xa-ar",
-    "hi": "in-en",
-}
-LOCATION_TO_REGION = {
-    "united states": "us-en",
-    "usa": "us-en",
-    "china": "cn-zh",
-    "mainland china": "cn-zh",
-    "taiwan": "tw-tzh",
-    "hong kong": "hk-tzh",
-    "germany": "de-de",
-    "france": "fr-fr",
-    "italy": "it-it",
-    "united kingdom": "uk-en",
-    "uk": "uk-en",
-    "japan": "jp-jp",
-    "south korea": "kr-kr",
-    "mexico": "mx-es",
-    "spain": "es-es",
-    "brazil": "br-pt",
-    "india": "in-en",
-    "canada": "ca-en",
-    "canada-fr": "ca-fr",
-    "australia": "au-en",
-}
+VALID_CATEGORIES = frozenset({"text", "images", "news", "videos", "books"})
+SAFESEARCH_LEVELS = frozenset({"on", "moderate", "off"})
+TIMELIMIT_VALUES = frozenset({"d", "w", "m", "y"})
+# Enum lists for the tool schema, sorted once at import.
+_VALID_CATEGORIES_SORTED = sorted(VALID_CATEGORIES)
+_SAFESEARCH_LEVELS_SORTED = sorted(SAFESEARCH_LEVELS)
+_TIMELIMIT_VALUES_SORTED = sorted(TIMELIMIT_VALUES)
+LANG_TO_REGION: Mapping[str, str] = MappingProxyType(
+    {
+        "en": "us-en",
+        "en-us": "us-en",
+        "en-gb": "uk-en",
+        "zh": "cn-zh",
+        "zh-cn": "cn-zh",
+        "zh-tw": "tw-tzh",
+        "zh-hk": "hk-tzh",
+        "es": "es-es",
+        "es-mx": "mx-es",
+        "fr": "fr-fr",
+        "de": "de-de",
+        "it": "it-it",
+        "ja": "jp-jp",
+        "ko": "kr-kr",
+        "pt": "pt-pt",
+        "pt-br": "br-pt",
+        "ru": "ru-ru",
+        "ar": "xa-ar",
+        "hi": "in-en",
+    }
+)
+LOCATION_TO_REGION: Mapping[str, str] = MappingProxyType(
+    {
+        "united states": "us-en",
+        "usa": "us-en",
+        "china": "cn-zh",
+        "mainland china": "cn-zh",
+        "taiwan": "tw-tzh",
+        "hong kong": "hk-tzh",
+        "germany": "de-de",
+        "france": "fr-fr",
+        "italy": "it-it",
+        "united kingdom": "uk-en",
+        "uk": "uk-en",
+        "japan": "jp-jp",
+        "south korea": "kr-kr",
+        "mexico": "mx-es",
+        "spain": "es-es",
+        "brazil": "br-pt",
+        "india": "in-en",
+        "canada": "ca-en",
+        "canada-fr": "ca-fr",
+        "australia": "au-en",
+    }
+)
 DEFAULT_MAX_RESULTS = 20
+UNLIMITED_RESULT_TOKENS = frozenset({"all", "none", "*", "unlimited"})
+TRUTHY_STRINGS = frozenset({"true", "1", "yes"})
+DOWNLOADABLE_FILE_TYPES = frozenset({"pdf", "docx", "image"})
+DOWNLOAD_URL_SCHEMES = frozenset({"http", "https"})
+# Per-category (output key, DDGS key, default) mapping used by _format_results.
+RESULT_SCHEMAS: Dict[str, Tuple[Tuple[str, str, Any], ...]] = {
+    "text": (("title", "title", ""), ("url", "href", ""), ("snippet", "body", "")),
+    "images": (
+        ("title", "title", ""),
+        ("image_url", "image", ""),
+        ("thumbnail", "thumbnail", ""),
+        ("page_url", "url", ""),
+        ("source", "source", ""),
+        ("width", "width", None),
+        ("height", "height", None),
+    ),
+    "news": (
+        ("title", "title", ""),
+        ("url", "url", ""),
+        ("source", "source", ""),
+        ("snippet", "body", ""),
+        ("date", "date", ""),
+        ("image_url", "image", ""),
+    ),
+    "videos": (
+        ("title", "title", ""),
+        ("url", "content", None),  # falls back to embed_url
+        ("description", "description", ""),
+        ("duration", "duration", ""),
+        ("provider", "provider", ""),
+        ("publisher", "publisher", ""),
+        ("embed_url", "embed_url", ""),
+        ("thumbnails", "images", {}),
+    ),
+    "books": (
+        ("title", "title", ""),
+        ("url", "url", ""),
+        ("author", "author", ""),
+        ("publisher", "publisher", ""),
+        ("info", "info", ""),
+        ("thumbnail", "thumbnail", ""),
+    ),
+}
+INT_RESULT_FIELDS = frozenset({"width", "height"})
+# Fields kept on every result regardless of the requested field filter.
+_REQUIRED_RESULT_FIELDS = frozenset({"rank", "backend"})
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 
 def _maybe_int(value: Any) -> int | None:
+    # DDGS usually returns dimensions as ints already; bool is excluded so it still becomes 0/1.
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
     try:
         return int(value)
     except (TypeError, ValueError):
         return None
 
 
+def _normalize_key(value: str) -> str:
+    """Return ``value.strip().lower()``, skipping both calls for already-normalized ASCII input."""
+    if value.isascii() and value.islower() and not value[0].isspace() and not value[-1].isspace():
+        return value
+    return value.strip().lower()
+
+
+def _error_result(error: str, detail: str) -> Dict[str, Any]:
+    """Build the standard failure payload returned by tool executors."""
+    return {"success": False, "error": error, "detail": detail}
+
+
+def _optional_text(value: Any) -> str | None:
+    """Return ``value`` stripped when it is a non-blank string, otherwise None."""
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped:
+            return stripped
+    return None
+
+
+def _clean_text_list(values: Iterable[Any]) -> List[str]:
+    """Stringify and strip each item, dropping the ones that end up empty."""
+    return [text for item in values if (text := str(item).strip())]
+
+
+_DefaultT = TypeVar("_DefaultT", bound=Optional[str])
+
+
+def _coerce_choice(value: Any, choices: FrozenSet[str], default: _DefaultT) -> str | _DefaultT:
+    """Return ``value`` lowercased when it names one of ``choices``, otherwise ``default``."""
+    if not isinstance(value, str):
+        return default
+    if value in choices:
+        return value
+    lowered = value.lower()
+    return lowered if lowered in choices else default
+
+
 def _resolve_region(region: Optional[str], location: Optional[str], lang: Optional[str], fallback: str) -> str:
-    if isinstance(region, str) and region.strip():
-        return region.strip().lower()
-
-    if isinstance(location, str):
-        key = location.strip().lower()
-        if key in LOCATION_TO_REGION:
-            return LOCATION_TO_REGION[key]
-
-    if isinstance(lang, str):
-        key = lang.strip().lower()
-        if key in LANG_TO_REGION:
-            return LANG_TO_REGION[key]
+    if isinstance(region, str) and region:
+        key = _normalize_key(region)
+        if key:
+            return key
+
+    if isinstance(location, str) and location:
+        mapped = LOCATION_TO_REGION.get(_normalize_key(location))
+        if mapped is not None:
+            return mapped
+
+    if isinstance(lang, str) and lang:
+        key = _normalize_key(lang)
+        mapped = LANG_TO_REGION.get(key)
+        if mapped is not None:
+            return mapped
         if "-" in key:
             lang_part, country_part = key.split("-", 1)
             return f"{country_part}-{lang_part}"
@@ -104,12 +213,16 @@ def _resolve_region(region: Optional[str], location: Optional[str], lang: Option
     return fallback
 
 
-def _filter_fields(result: Dict[str, Any], requested: Set[str] | None) -> Dict[str, Any]:
+def _resolve_allowed_fields(requested: Set[str] | None) -> FrozenSet[str] | None:
+    """Return the field whitelist for a search call, or None when every field is kept."""
     if not requested or "*" in requested:
-        return result
+        return None
+    return frozenset(requested) | _REQUIRED_RESULT_FIELDS
+
 
-    allowed = set(requested) | {"rank", "backend"}
-    return {key: value for key, value in result.items() if key in allowed}
+def _session_owner_id(db: Session, session_id: int) -> int | None:
+    """Return the owning user id for a chat session without loading the full row."""
+    return db.query(SessionModel.user_id).filter(SessionModel.id == session_id).scalar()
 
 
 def _persist_single_webp_image(
@@ -121,37 +234,42 @@ def _persist_single_webp_image(
     *,
     file_type: str = "screenshot",
 ) -> int:
-    """Store a single WebP image for the given session and return its file id."""
+    """Store a single WebP image for the given session and return its file id.
+
+    The WebP bytes are stored once, on the ``FileImage`` row; the ``File`` row
+    keeps an empty ``file_data`` (see ``File.content``).
+    """
     db = SessionLocal()
     try:
-        session_record = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-        if session_record is None:
+        user_id = _session_owner_id(db, session_id)
+        if user_id is None:
             raise ValueError(f"Session {session_id} not found")
 
-        user_id = session_record.user_id
         new_file = File(
             user_id=user_id,
             filename=filename,
             file_type=file_type,
             mime_type="image/webp",
-            file_data=webp_bytes,
+            file_data=b"",
             file_size=len(webp_bytes),
             processing_status="completed",
         )
         db.add(new_file)
         db.flush()
 
-        file_image = FileImage(
-            file_id=new_file.id,
-            page_number=1,
-            image_data=webp_bytes,
-            width=width,
-            height=height,
-            file_size=len(webp_bytes),
+        db.add(
+            FileImage(
+                file_id=new_file.id,
+                page_number=1,
+                image_data=webp_bytes,
+                width=width,
+                height=height,
+                file_size=len(webp_bytes),
+            )
         )
-        db.add(file_image)
+        file_id = new_file.id
         db.commit()
-        return new_file.id
+        return file_id
     except Exception:
         db.rollback()
         raise
@@ -159,6 +277,52 @@ def _persist_single_webp_image(
         db.close()
 
 
+_ResultFormatter = Callable[[int, Dict[str, Any]], Dict[str, Any]]
+
+
+def _make_result_formatter(category: str, backend: str, allowed: FrozenSet[str] | None) -> _ResultFormatter:
+    """Return a ``(rank, raw_item) -> result`` builder specialized for one search call.
+
+    When ``allowed`` is given, only the whitelisted keys are ever read or coerced.
+    """
+    schema = RESULT_SCHEMAS.get(category, ())
+    if allowed is not None:
+        schema = tuple(field for field in schema if field[0] in allowed)
+
+    # rank and backend are always kept (see _REQUIRED_RESULT_FIELDS).
+    def finish(base: Dict[str, Any], idx: int) -> Dict[str, Any]:
+        base["rank"] = idx
+        base["backend"] = backend
+        return base
+
+    if any(out_key in INT_RESULT_FIELDS for out_key, _, _ in schema):
+        int_fields = tuple(
+            (out_key, src_key, default, out_key in INT_RESULT_FIELDS) for out_key, src_key, default in schema
+        )
+
+        def build(idx: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            base = {
+                out_key: _maybe_int(item.get(src_key)) if is_int else item.get(src_key, default)
+                for out_key, src_key, default, is_int in int_fields
+            }
+            return finish(base, idx)
+
+    elif category == "videos" and any(out_key == "url" for out_key, _, _ in schema):
+
+        def build(idx: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            base = {out_key: item.get(src_key, default) for out_key, src_key, default in schema}
+            if not base["url"]:
+                base["url"] = item.get("embed_url", "")
+            return finish(base, idx)
+
+    else:
+
+        def build(idx: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            return finish({out_key: item.get(src_key, default) for out_key, src_key, default in schema}, idx)
+
+    return build
+
+
 def _format_results(
     raw_items: List[Dict[str, Any]],
     *,
@@ -166,70 +330,22 @@ def _format_results(
     backend: str,
     requested_fields: Set[str] | None,
 ) -> List[Dict[str, Any]]:
-    formatted: List[Dict[str, Any]] = []
-
-    for idx, item in enumerate(raw_items, start=1):
-        if category == "text":
-            base = {
+    allowed = _resolve_allowed_fields(requested_fields)
+    if category == "text" and allowed is None:
+        # Hot path for the default category; mirrors RESULT_SCHEMAS["text"].
+        return [
+            {
                 "title": item.get("title", ""),
                 "url": item.get("href", ""),
                 "snippet": item.get("body", ""),
                 "rank": idx,
                 "backend": backend,
             }
-        elif category == "images":
-            base = {
-                "title": item.get("title", ""),
-                "image_url": item.get("image", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "page_url": item.get("url", ""),
-                "source": item.get("source", ""),
-                "width": _maybe_int(item.get("width")),
-                "height": _maybe_int(item.get("height")),
-                "rank": idx,
-                "backend": backend,
-            }
-        elif category == "news":
-            base = {
-                "title": item.get("title", ""),
-                "url": item.get("url", ""),
-                "source": item.get("source", ""),
-                "snippet": item.get("body", ""),
-                "date": item.get("date", ""),
-                "image_url": item.get("image", ""),
-                "rank": idx,
-                "backend": backend,
-            }
-        elif category == "videos":
-            base = {
-                "title": item.get("title", ""),
-                "url": item.get("content") or item.get("embed_url", ""),
-                "description": item.get("description", ""),
-                "duration": item.get("duration", ""),
-                "provider": item.get("provider", ""),
-                "publisher": item.get("publisher", ""),
-                "embed_url": item.get("embed_url", ""),
-                "thumbnails": item.get("images", {}),
-                "rank": idx,
-                "backend": backend,
-            }
-        elif category == "books":
-            base = {
-                "title": item.get("title", ""),
-                "url": item.get("url", ""),
-                "author": item.get("author", ""),
-                "publisher": item.get("publisher", ""),
-                "info": item.get("info", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "rank": idx,
-                "backend": backend,
-            }
-        else:  # pragma: no cover - safeguarded by category validation
-            base = {"rank": idx, "backend": backend}
+            for idx, item in enumerate(raw_items, start=1)
+        ]
 
-        formatted.append(_filter_fields(base, requested_fields))
-
-    return formatted
+    build = _make_result_formatter(category, backend, allowed)
+    return [build(idx, item) for idx, item in enumerate(raw_items, start=1)]
 
 
 # Tool definitions.
@@ -284,6 +400,10 @@ AVAILABLE_TOOLS = [
                         "minimum": 1,
                         "description": "Override navigation timeout in milliseconds.",
                     },
+                    "include_title": {
+                        "type": "boolean",
+                        "description": "Set to false to skip reading the page title (saves one browser round-trip). Defaults to true.",
+                    },
                     "actions": {
                         "type": "array",
                         "description": "Optional action list executed after navigation. Supported types: click, fill, wait_for_selector, wait_for_timeout.",
@@ -436,6 +556,10 @@ AVAILABLE_TOOLS = [
                         "minimum": 1,
                         "description": "Optional navigation timeout in milliseconds.",
                     },
+                    "include_title": {
+                        "type": "boolean",
+                        "description": "Set to false to skip reading the page title (saves one browser round-trip). Defaults to true.",
+                    },
                 },
                 "required": ["url", "selectors"],
             },
@@ -499,7 +623,7 @@ AVAILABLE_TOOLS = [
                     },
                     "category": {
                         "type": "string",
-                        "enum": sorted(VALID_CATEGORIES),
+                        "enum": _VALID_CATEGORIES_SORTED,
                         "description": "Search domain: text, images, news, videos, or books. Defaults to text.",
                     },
                     "backend": {
@@ -520,12 +644,12 @@ AVAILABLE_TOOLS = [
                     },
                     "safesearch": {
                         "type": "string",
-                        "enum": sorted(SAFESEARCH_LEVELS),
+                        "enum": _SAFESEARCH_LEVELS_SORTED,
                         "description": "Safe-search level: on, moderate, or off.",
                     },
                     "timelimit": {
                         "type": "string",
-                        "enum": sorted(TIMELIMIT_VALUES),
+                        "enum": _TIMELIMIT_VALUES_SORTED,
                         "description": "Time filter: d=day, w=week, m=month, y=year.",
                     },
                     "max_results": {
@@ -756,24 +880,18 @@ def execute_tool(
     Returns:
         Dict[str, Any]: Tool response payload.
     """
-    if tool_name == "get_current_time":
-        return execute_get_current_time(tool_input)
-    elif tool_name == "ddgs_search":
-        return execute_ddgs_search(tool_input)
-    elif tool_name == "ai_search_web":
-        return execute_ai_search_web(tool_input)
-    elif tool_name == "playwright_browse":
-        return execute_playwright_browse(tool_input, session_id)
-    elif tool_name == "playwright_probe":
-        return execute_playwright_probe(tool_input)
-    elif tool_name == "download_and_convert_file":
-        return execute_download_and_convert_file(tool_input, session_id)
-    elif tool_name == "reasoning":
-        return execute_reasoning(tool_input, messages_history or [], session_id or 0)
-    elif tool_name == "explore_tool":
+    if tool_name == "explore_tool":
         raise ValueError("explore_tool is handled asynchronously within the agent loop.")
-    else:
+    handler = _TOOL_DISPATCH.get(tool_name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {tool_name}")
+    return handler(tool_input, messages_history, session_id)
+
+
+@lru_cache(maxsize=512)
+def _get_zone(timezone_name: str) -> ZoneInfo:
+    """Return a cached ``ZoneInfo``; lookup failures raise and are not cached."""
+    return ZoneInfo(timezone_name)
 
 
 def execute_get_current_time(tool_input: Dict[str, Any]) -> Dict[str, Any]:
@@ -789,7 +907,7 @@ def execute_get_current_time(tool_input: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         # Resolve the requested timezone.
-        tz = ZoneInfo(timezone_name)
+        tz = _get_zone(timezone_name)
         now = datetime.now(tz)
 
         return {
@@ -802,8 +920,11 @@ def execute_get_current_time(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             "hour": now.hour,
             "minute": now.minute,
             "second": now.second,
-            "weekday": now.strftime("%A"),
-            "formatted": now.strftime("%Y-%m-%d %H:%M:%S %Z"),
+            "weekday": WEEKDAY_NAMES[now.weekday()],
+            "formatted": (
+                f"{now.year:04d}-{now.month:02d}-{now.day:02d} "
+                f"{now.hour:02d}:{now.minute:02d}:{now.second:02d} {now.tzname() or ''}"
+            ),
         }
     except Exception as e:
         return {
@@ -826,12 +947,9 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     elif not isinstance(raw_queries, list):
         raw_queries = []
 
-    queries: List[str] = []
-    for candidate in raw_queries:
-        if isinstance(candidate, str):
-            stripped = candidate.strip()
-            if stripped:
-                queries.append(stripped)
+    queries: List[str] = [
+        stripped for candidate in raw_queries if isinstance(candidate, str) and (stripped := candidate.strip())
+    ]
 
     if not queries:
         return {
@@ -841,43 +959,36 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     category_default = config.DDGS_DEFAULT_CATEGORY if config.DDGS_DEFAULT_CATEGORY in VALID_CATEGORIES else "text"
-    category = str(tool_input.get("category", category_default)).lower()
-    if category not in VALID_CATEGORIES:
-        category = category_default
+    category = _coerce_choice(tool_input.get("category", category_default), VALID_CATEGORIES, category_default)
 
     backend_default = config.DDGS_DEFAULT_BACKEND or "auto"
     backend_value = tool_input.get("backend", backend_default)
-    backend = str(backend_value).strip() if isinstance(backend_value, str) else backend_default
+    backend = backend_value.strip() if isinstance(backend_value, str) else backend_default
     backend = backend or backend_default
 
     safesearch_default = (
         config.DDGS_DEFAULT_SAFESEARCH if config.DDGS_DEFAULT_SAFESEARCH in SAFESEARCH_LEVELS else "moderate"
     )
     safesearch_value = tool_input.get("safesearch", safesearch_default)
-    safesearch = str(safesearch_value).lower() if isinstance(safesearch_value, str) else safesearch_default
-    if safesearch not in SAFESEARCH_LEVELS:
-        safesearch = safesearch_default
+    safesearch = _coerce_choice(safesearch_value, SAFESEARCH_LEVELS, safesearch_default)
 
     timelimit_default = config.DDGS_DEFAULT_TIMELIMIT
     timelimit_value = tool_input.get("timelimit", timelimit_default)
-    timelimit: str | None
-    if isinstance(timelimit_value, str) and timelimit_value.strip():
-        tl_candidate = timelimit_value.strip().lower()
-        timelimit = tl_candidate if tl_candidate in TIMELIMIT_VALUES else None
-    else:
-        timelimit = None
+    timelimit = _coerce_choice(
+        timelimit_value.strip() if isinstance(timelimit_value, str) else None, TIMELIMIT_VALUES, None
+    )
 
     region_value = tool_input.get("region")
-    region_override = region_value.strip() if isinstance(region_value, str) and region_value.strip() else None
+    region_override = _optional_text(region_value)
 
     lang_value = tool_input.get("lang")
-    lang = lang_value.strip() if isinstance(lang_value, str) and lang_value.strip() else None
+    lang = _optional_text(lang_value)
 
     location_value = tool_input.get("location")
-    location = location_value.strip() if isinstance(location_value, str) and location_value.strip() else None
+    location = _optional_text(location_value)
 
     notes_value = tool_input.get("notes")
-    notes = notes_value.strip() if isinstance(notes_value, str) and notes_value.strip() else None
+    notes = _optional_text(notes_value)
 
     max_results_raw = tool_input.get("max_results")
     max_results: int | None = DEFAULT_MAX_RESULTS
@@ -886,13 +997,13 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             max_results = min(max_results_raw, 200)
         else:
             max_results = None
-    elif isinstance(max_results_raw, str) and max_results_raw.strip().lower() in {"all", "none", "*", "unlimited"}:
+    elif isinstance(max_results_raw, str) and max_results_raw.strip().lower() in UNLIMITED_RESULT_TOKENS:
         max_results = None
 
     fields_raw = tool_input.get("collect_per_result_fields")
     collect_fields: Set[str] | None = None
     if isinstance(fields_raw, list):
-        collect_fields = {str(field).strip() for field in fields_raw if str(field).strip()}
+        collect_fields = set(_clean_text_list(fields_raw))
         if not collect_fields or "*" in collect_fields:
             collect_fields = None
 
@@ -903,11 +1014,11 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     data_entries: List[Dict[str, Any]] = []
     overall_success = False
 
-    for query in queries:
-        resolved_region = _resolve_region(region_override, location, lang, region_fallback)
+    resolved_region = _resolve_region(region_override, location, lang, region_fallback)
 
+    def search_one(query: str) -> SearchResult | DDGSSearchError:
         try:
-            result = client.search(
+            return client.search(
                 query=query,
                 category=category,
                 backend=backend,
@@ -917,16 +1028,37 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
                 max_results=max_results,
             )
         except DDGSSearchError as exc:
+            return exc
+
+    # Queries are independent network calls; fan them out and keep results in query order.
+    max_workers = min(len(queries), config.DDGS_MAX_PARALLEL_QUERIES)
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ddgs-search") as executor:
+            outcomes = list(executor.map(search_one, queries))
+    else:
+        outcomes = [search_one(query) for query in queries]
+
+    # Metadata shared by every query entry, built once per call.
+    shared_meta: Dict[str, Any] = {
+        "category": category,
+        "backend": backend,
+        "region": resolved_region,
+        "safesearch": safesearch,
+        "timelimit": timelimit,
+    }
+    requested_backend_list = [b.strip() for b in backend.split(",") if b.strip()] or [backend]
+    fields_included = sorted(collect_fields) if collect_fields else None
+    debug_logging = logger.isEnabledFor(logging.DEBUG)
+
+    for query, outcome in zip(queries, outcomes, strict=True):
+        if isinstance(outcome, DDGSSearchError):
+            exc = outcome
             failure_meta = {
                 "query": query,
-                "category": category,
-                "backend": backend,
-                "region": resolved_region,
-                "safesearch": safesearch,
-                "timelimit": timelimit,
+                **shared_meta,
                 "cache_hit": False,
                 "duration_ms": 0,
-                "backend_list": [b.strip() for b in backend.split(",") if b.strip()] or [backend],
+                "backend_list": requested_backend_list,
                 "max_results_requested": max_results,
             }
             if notes:
@@ -953,19 +1085,16 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             )
             continue
 
-        clean_items = [{k: v for k, v in item.items() if not str(k).startswith("_")} for item in result.items]
+        result = outcome
+        # The formatter only reads schema keys, so the client's annotations need not be stripped first.
         formatted_results = _format_results(
-            clean_items, category=category, backend=backend, requested_fields=collect_fields
+            result.items, category=category, backend=backend, requested_fields=collect_fields
         )
 
         meta: Dict[str, Any] = {
             "query": query,
-            "category": category,
-            "backend": backend,
+            **shared_meta,
             "backend_list": list(result.backend_list),
-            "region": resolved_region,
-            "safesearch": safesearch,
-            "timelimit": timelimit,
             "result_count": len(formatted_results),
             "cache_hit": result.cache_hit,
             "duration_ms": result.duration_ms,
@@ -973,12 +1102,14 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             "max_results_effective": result.max_results,
         }
 
-        if collect_fields:
-            meta["fields_included"] = sorted(collect_fields)
+        if fields_included:
+            meta["fields_included"] = fields_included
         if notes:
             meta["notes"] = notes
         if include_raw:
-            meta["raw_results"] = clean_items
+            meta["raw_results"] = [
+                {k: v for k, v in item.items() if k not in RESULT_ANNOTATION_KEYS} for item in result.items
+            ]
 
         data_entries.append(
             {
@@ -991,14 +1122,15 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
 
         overall_success = True
 
-        logger.debug(
-            "DDGS search succeeded",
-            extra={
-                "ddgs_query": query,
-                "ddgs_result_count": len(formatted_results),
-                "ddgs_cache_hit": result.cache_hit,
-            },
-        )
+        if debug_logging:
+            logger.debug(
+                "DDGS search succeeded",
+                extra={
+                    "ddgs_query": query,
+                    "ddgs_result_count": len(formatted_results),
+                    "ddgs_cache_hit": result.cache_hit,
+                },
+            )
 
     response: Dict[str, Any] = {
         "success": overall_success,
@@ -1016,6 +1148,19 @@ def execute_ddgs_search(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     return response
 
 
+_call_search_llm: Optional[Callable[[str, str], str]] = None
+
+
+def _get_call_search_llm() -> Callable[[str, str], str]:
+    """Resolve ``call_search_llm`` once (``app.services.llm`` imports this module, so it is not a top-level import)."""
+    global _call_search_llm
+    if _call_search_llm is None:
+        from app.services.llm import call_search_llm
+
+        _call_search_llm = call_search_llm
+    return _call_search_llm
+
+
 def execute_ai_search_web(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     """Invoke a web-aware LLM as a fallback search mechanism.
 
@@ -1025,9 +1170,7 @@ def execute_ai_search_web(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Result payload indicating success and any content.
     """
-    from app.config import config
-    from app.services.llm import call_search_llm
-
+    call_search_llm = _get_call_search_llm()
     query = tool_input.get("query", "")
 
     if not query:
@@ -1045,25 +1188,38 @@ Requirements:
 4. Present results in a clear, structured format
 5. If information appears uncertain, state the confidence level and suggest verification steps"""
 
-    # Try each configured model until one succeeds.
+    # Query every configured model at once and take the first successful answer.
     last_error = None
-    for model_id in config.WEB_SEARCH_MODELS:
+    models = list(config.WEB_SEARCH_MODELS)
+    if models:
+        executor = ThreadPoolExecutor(max_workers=len(models), thread_name_prefix="web-search")
+        futures = {executor.submit(call_search_llm, search_prompt, model_id): model_id for model_id in models}
         try:
-            result = call_search_llm(search_prompt, model_id)
-            return {
-                "success": True,
-                "query": query,
-                "result": result,
-                "model_used": model_id,
-                "disclaimer": (
-                    "This result comes from a browsing-capable language model. Verify critical details before use."
-                ),
-            }
-        except Exception as e:
-            last_error = str(e)
-            # Log the error and continue.
-            print(f"Search model {model_id} failed: {last_error}")
-            continue
+            for future in as_completed(futures, timeout=config.WEB_SEARCH_TIMEOUT):
+                model_id = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    last_error = str(e)
+                    logger.warning("Search model %s failed: %s", model_id, last_error)
+                    continue
+                return {
+                    "success": True,
+                    "query": query,
+                    "result": result,
+                    "model_used": model_id,
+                    "disclaimer": (
+                        "This result comes from a browsing-capable language model. Verify critical details before use."
+                    ),
+                }
+        except FuturesTimeoutError:
+            last_error = f"No search model answered within {config.WEB_SEARCH_TIMEOUT}s"
+            logger.warning(
+                "Web search timed out after %ss waiting on %d model(s)", config.WEB_SEARCH_TIMEOUT, len(models)
+            )
+        finally:
+            # Slower models still running are abandoned; their results are discarded.
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # Every model failed.
     return {
@@ -1083,24 +1239,16 @@ def execute_reasoning(
 ) -> Dict[str, Any]:
     """Validate and echo the reasoning content provided by the primary model."""
     if not isinstance(tool_input, dict):
-        return {
-            "success": False,
-            "error": "invalid_arguments",
-            "detail": "Reasoning tool input must be an object.",
-        }
+        return _error_result("invalid_arguments", "Reasoning tool input must be an object.")
 
     summary_raw = tool_input.get("summary")
     summary = str(summary_raw).strip() if summary_raw is not None else ""
     if not summary:
-        return {
-            "success": False,
-            "error": "missing_summary",
-            "detail": "Provide a non-empty 'summary' describing the current state.",
-        }
+        return _error_result("missing_summary", "Provide a non-empty 'summary' describing the current state.")
 
     next_actions_raw = tool_input.get("next_actions")
     if isinstance(next_actions_raw, list):
-        next_actions = [str(item).strip() for item in next_actions_raw if str(item).strip()]
+        next_actions = _clean_text_list(next_actions_raw)
     else:
         next_actions = []
         if next_actions_raw is not None:
@@ -1109,17 +1257,16 @@ def execute_reasoning(
                 next_actions.append(candidate)
 
     if not next_actions:
-        return {
-            "success": False,
-            "error": "missing_next_actions",
-            "detail": "Include at least one action in 'next_actions', even if it is to proceed with the final reply.",
-        }
+        return _error_result(
+            "missing_next_actions",
+            "Include at least one action in 'next_actions', even if it is to proceed with the final reply.",
+        )
 
     ready_value = tool_input.get("ready_to_reply")
     if isinstance(ready_value, bool):
         ready_to_reply = ready_value
     elif isinstance(ready_value, str):
-        ready_to_reply = ready_value.strip().lower() in {"true", "1", "yes"}
+        ready_to_reply = ready_value.strip().lower() in TRUTHY_STRINGS
     else:
         ready_to_reply = bool(ready_value)
 
@@ -1147,10 +1294,7 @@ def execute_reasoning(
     issues_raw = tool_input.get("issues")
     issues: List[str] = []
     if isinstance(issues_raw, list):
-        issues = [str(item).strip() for item in issues_raw if str(item).strip()]
-
-    notes_raw = tool_input.get("notes")
-    notes = str(notes_raw).strip() if notes_raw is not None else None
+        issues = _clean_text_list(issues_raw)
 
     notes_raw = tool_input.get("notes")
     notes = str(notes_raw).strip() if notes_raw is not None else None
@@ -1188,18 +1332,11 @@ def execute_playwright_browse(tool_input: Dict[str, Any], session_id: Optional[i
     if not isinstance(result, dict):
         return result
 
-    screenshot_base64 = result.pop("screenshot_base64", None)
+    png_bytes = result.pop("screenshot_png", None)
     screenshot_note = tool_input.get("notes")
 
-    if screenshot_base64 and session_id not in (None, 0):
+    if png_bytes and session_id not in (None, 0):
         warnings: List[str] = []
-        try:
-            png_bytes = base64.b64decode(screenshot_base64)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            logger.warning("Failed to decode Playwright screenshot", exc_info=exc)
-            warnings.append("screenshot_decode_failed")
-            png_bytes = None
-
         file_id: Optional[int] = None
         if png_bytes:
             try:
@@ -1210,7 +1347,7 @@ def execute_playwright_browse(tool_input: Dict[str, Any], session_id: Optional[i
             else:
                 filename = tool_input.get("filename")
                 if not isinstance(filename, str) or not filename.strip():
-                    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+                    timestamp = time.strftime("%Y%m%d%H%M%S", time.gmtime())
                     filename = f"playwright-screenshot-{timestamp}.webp"
                 else:
                     filename = filename.strip()
@@ -1245,7 +1382,7 @@ def execute_playwright_browse(tool_input: Dict[str, Any], session_id: Optional[i
 
         if warnings:
             result.setdefault("warnings", warnings)
-    elif screenshot_base64:
+    elif png_bytes:
         result.setdefault("warnings", []).append("screenshot_not_persisted")
 
     return result
@@ -1259,78 +1396,45 @@ def execute_playwright_probe(tool_input: Dict[str, Any]) -> Dict[str, Any]:
 def execute_download_and_convert_file(tool_input: Dict[str, Any], session_id: Optional[int]) -> Dict[str, Any]:
     """Download a remote document and convert it to WebP images."""
     if session_id in (None, 0):
-        return {
-            "success": False,
-            "error": "missing_session",
-            "detail": "Session context is required to store converted files.",
-        }
+        return _error_result("missing_session", "Session context is required to store converted files.")
 
     if not isinstance(tool_input, dict):
-        return {
-            "success": False,
-            "error": "invalid_arguments",
-            "detail": "Tool input must be an object.",
-        }
+        return _error_result("invalid_arguments", "Tool input must be an object.")
 
     file_url_raw = tool_input.get("file_url")
     file_type_raw = tool_input.get("file_type")
 
     if not isinstance(file_url_raw, str) or not file_url_raw.strip():
-        return {
-            "success": False,
-            "error": "invalid_url",
-            "detail": "Parameter 'file_url' must be a non-empty string.",
-        }
+        return _error_result("invalid_url", "Parameter 'file_url' must be a non-empty string.")
     file_url = file_url_raw.strip()
 
     if not isinstance(file_type_raw, str) or not file_type_raw.strip():
-        return {
-            "success": False,
-            "error": "invalid_file_type",
-            "detail": "Parameter 'file_type' must be one of 'pdf', 'docx', or 'image'.",
-        }
+        return _error_result("invalid_file_type", "Parameter 'file_type' must be one of 'pdf', 'docx', or 'image'.")
 
     file_type = file_type_raw.strip().lower()
-    if file_type not in {"pdf", "docx", "image"}:
-        return {
-            "success": False,
-            "error": "unsupported_file_type",
-            "detail": "Supported file types are 'pdf', 'docx', and 'image'.",
-        }
+    if file_type not in DOWNLOADABLE_FILE_TYPES:
+        return _error_result("unsupported_file_type", "Supported file types are 'pdf', 'docx', and 'image'.")
 
-    parsed_url = urlparse(file_url)
-    if parsed_url.scheme not in {"http", "https"}:
-        return {
-            "success": False,
-            "error": "unsupported_scheme",
-            "detail": "Only http and https URLs are supported for downloads.",
-        }
+    # The full parse is deferred until the path is needed for the stored filename.
+    scheme, separator, _ = file_url.partition("://")
+    if not separator or scheme.lower() not in DOWNLOAD_URL_SCHEMES:
+        return _error_result("unsupported_scheme", "Only http and https URLs are supported for downloads.")
 
     try:
         file_bytes, response_headers = playwright_manager.download_file(
             file_url, timeout=config.PLAYWRIGHT_NAVIGATION_TIMEOUT_MS
         )
     except PlaywrightError as exc:  # pragma: no cover - depends on runtime environment
-        return {
-            "success": False,
-            "error": "download_failed",
-            "detail": str(exc),
-        }
+        return _error_result("download_failed", str(exc))
 
     if not file_bytes:
-        return {
-            "success": False,
-            "error": "empty_file",
-            "detail": "Downloaded file was empty.",
-        }
+        return _error_result("empty_file", "Downloaded file was empty.")
 
     max_size = max(config.PLAYWRIGHT_MAX_DOWNLOAD_SIZE_BYTES, 0)
     if max_size and len(file_bytes) > max_size:
-        return {
-            "success": False,
-            "error": "file_too_large",
-            "detail": (f"File size {len(file_bytes)} bytes exceeds the configured limit of {max_size} bytes."),
-        }
+        return _error_result(
+            "file_too_large", f"File size {len(file_bytes)} bytes exceeds the configured limit of {max_size} bytes."
+        )
 
     try:
         if file_type == "docx":
@@ -1341,44 +1445,50 @@ def execute_download_and_convert_file(tool_input: Dict[str, Any], session_id: Op
             compressed, width, height = compress_image(file_bytes, config.IMAGE_MAX_DIMENSION)
             images = [(compressed, width, height)]
     except FileProcessingError as exc:
-        return {
-            "success": False,
-            "error": "conversion_failed",
-            "detail": str(exc),
-        }
+        return _error_result("conversion_failed", str(exc))
     except Exception as exc:  # pragma: no cover - defensive guard
-        return {
-            "success": False,
-            "error": "conversion_failed",
-            "detail": str(exc),
-        }
+        return _error_result("conversion_failed", str(exc))
 
     if not images:
-        return {
-            "success": False,
-            "error": "conversion_empty",
-            "detail": "No images were produced during conversion.",
-        }
+        return _error_result("conversion_empty", "No images were produced during conversion.")
 
-    db = SessionLocal()
-    try:
-        session_record = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-        if session_record is None:
-            return {
-                "success": False,
-                "error": "session_not_found",
-                "detail": f"Session {session_id} was not found.",
-            }
+    url_path = unquote(urlparse(file_url).path or "")
+    original_name = Path(url_path).name or f"downloaded.{file_type}"
 
-        user_id = session_record.user_id
-        url_path = unquote(parsed_url.path or "")
-        original_name = Path(url_path).name or f"downloaded.{file_type}"
+    # Walk the pages once, producing the archive entry, row parameters and data-URL block for each,
+    # so the CPU-bound work is done before the database session is opened.
+    archive_buffer = io.BytesIO()
+    page_rows: List[Dict[str, Any]] = []
+    image_blocks: List[Dict[str, Any]] = []
+    # WebP pages are already compressed, so they are stored rather than deflated.
+    with zipfile.ZipFile(archive_buffer, mode="w", compression=zipfile.ZIP_STORED) as zip_file:
+        for idx, (img_bytes, width, height) in enumerate(images, start=1):
+            zip_file.writestr(f"page_{idx}.webp", img_bytes)
+            page_rows.append(
+                {
+                    "page_number": idx,
+                    "image_data": img_bytes,
+                    "width": width,
+                    "height": height,
+                    "file_size": len(img_bytes),
+                }
+            )
+            image_blocks.append(
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:image/webp;base64,{encode_base64(img_bytes)}",
+                        "detail": "high",
+                    },
+                }
+            )
+    archive_bytes = archive_buffer.getvalue()
 
-        archive_buffer = io.BytesIO()
-        with zipfile.ZipFile(archive_buffer, mode="w") as zip_file:
-            for idx, (img_bytes, _, _) in enumerate(images, start=1):
-                zip_file.writestr(f"page_{idx}.webp", img_bytes)
-        archive_bytes = archive_buffer.getvalue()
+    db = SessionLocal()
+    try:
+        user_id = _session_owner_id(db, session_id)
+        if user_id is None:
+            return _error_result("session_not_found", f"Session {session_id} was not found.")
 
         new_file = File(
             user_id=user_id,
@@ -1392,38 +1502,19 @@ def execute_download_and_convert_file(tool_input: Dict[str, Any], session_id: Op
         db.add(new_file)
         db.flush()
 
-        for idx, (img_bytes, width, height) in enumerate(images, start=1):
-            file_image = FileImage(
-                file_id=new_file.id,
-                page_number=idx,
-                image_data=img_bytes,
-                width=width,
-                height=height,
-                file_size=len(img_bytes),
-            )
-            db.add(file_image)
+        file_id = new_file.id
+        for row in page_rows:
+            row["file_id"] = file_id
+        # One executemany for every page instead of a unit-of-work INSERT per row.
+        db.execute(insert(FileImage), page_rows)
 
         db.commit()
-        file_id = new_file.id
     except Exception:
         db.rollback()
         raise
     finally:
         db.close()
 
-    image_blocks: List[Dict[str, Any]] = []
-    for img_bytes, _, _ in images:
-        encoded = base64.b64encode(img_bytes).decode("utf-8")
-        image_blocks.append(
-            {
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/webp;base64,{encoded}",
-                    "detail": "high",
-                },
-            }
-        )
-
     metadata = {
         "original_file_name": original_name,
         "converted_pages": list(range(1, len(images) + 1)),
@@ -1445,6 +1536,22 @@ def execute_download_and_convert_file(tool_input: Dict[str, Any], session_id: Op
     }
 
 
+_ToolHandler = Callable[[Dict[str, Any], Optional[List[Dict[str, Any]]], Optional[int]], Dict[str, Any]]
+
+# Name -> executor table used by execute_tool; built after every executor is defined.
+_TOOL_DISPATCH: Dict[str, _ToolHandler] = {
+    "get_current_time": lambda tool_input, history, session_id: execute_get_current_time(tool_input),
+    "ddgs_search": lambda tool_input, history, session_id: execute_ddgs_search(tool_input),
+    "ai_search_web": lambda tool_input, history, session_id: execute_ai_search_web(tool_input),
+    "playwright_browse": lambda tool_input, history, session_id: execute_playwright_browse(tool_input, session_id),
+    "playwright_probe": lambda tool_input, history, session_id: execute_playwright_probe(tool_input),
+    "download_and_convert_file": lambda tool_input, history, session_id: execute_download_and_convert_file(
+        tool_input, session_id
+    ),
+    "reasoning": lambda tool_input, history, session_id: execute_reasoning(tool_input, history or [], session_id or 0),
+}
+
+
 def get_available_tools(transient_enabled: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
     """Return tool definitions visible to the main agent loop."""
     return tool_registry.for_session(transient_enabled)
@@ -1460,6 +1567,6 @@ def get_optional_tool_definitions(*, strip_meta: bool = False) -> List[Dict[str,
     return tool_registry.get_tools_by_tier({"extra", "mcp"}, strip_meta=strip_meta)
 
 
-def get_optional_tool_names() -> Set[str]:
-    """Return the set of tool names that are not part of the core tier."""
+def get_optional_tool_names() -> FrozenSet[str]:
+    """Return the read-only set of tool names that are not part of the core tier."""
     return tool_registry.optional_tool_names()
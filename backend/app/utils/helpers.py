@@ -1,20 +1,97 @@
 """Utility helpers."""
 
+import base64
 import json
-import time
-from typing import Any, Dict
+import zlib
+from time import time_ns
+from typing import Any, AsyncIterator, Dict, Iterable
 
+try:  # SIMD-accelerated base64 when available.
+    import pybase64
+except ImportError:  # pragma: no cover - optional dependency
+    pybase64 = None
 
-def sse_event(data: Dict[str, Any]) -> str:
+try:  # Faster JSON encoding for SSE frames when available.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# OPT_NON_STR_KEYS keeps parity with json.dumps, which stringifies int/float/bool/None keys;
+# OPT_APPEND_NEWLINE writes the first of the two frame-terminating newlines in C.
+_ORJSON_SSE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE if orjson is not None else 0
+
+
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def sse_event(data: Dict[str, Any]) -> bytes:
     """Format data into a Server-Sent Events payload.
 
     Args:
         data: JSON-serializable payload to emit.
 
     Returns:
-        str: SSE-formatted string containing the payload.
+        bytes: UTF-8 encoded SSE frame containing the payload.
+    """
+    if orjson is not None:
+        try:
+            return _SSE_PREFIX + orjson.dumps(data, option=_ORJSON_SSE_OPTIONS) + b"\n"
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits echoed from tool arguments; json.dumps still handles them.
+            pass
+    return _SSE_PREFIX + json.dumps(data, ensure_ascii=False).encode("utf-8") + _SSE_SUFFIX
+
+
+def sse_events(batch: Iterable[Dict[str, Any]]) -> bytes:
+    """Format several payloads into one buffer of consecutive SSE frames.
+
+    Args:
+        batch: JSON-serializable payloads to emit, in order.
+
+    Returns:
+        bytes: Concatenated SSE frames, written to the client in a single chunk.
+    """
+    return b"".join(sse_event(data) for data in batch)
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Return True when an ``Accept-Encoding`` header allows gzip.
+
+    Args:
+        accept_encoding: Raw header value, if the client sent one.
+
+    Returns:
+        bool: Whether gzip is listed without an explicit ``q=0``.
+    """
+    if not accept_encoding:
+        return False
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        quality = params.strip().lower().removeprefix("q=").strip()
+        try:
+            return not quality or float(quality) > 0
+        except ValueError:
+            return False
+    return False
+
+
+async def gzip_sse_stream(frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip an SSE byte stream, sync-flushing after every chunk.
+
+    Args:
+        frames: Uncompressed SSE chunks.
+
+    Yields:
+        bytes: Gzip data the client can inflate as soon as it arrives.
     """
-    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+    # Level 1 keeps CPU low; repetitive JSON frames still compress well.
+    compressor = zlib.compressobj(level=1, wbits=31)
+    async for frame in frames:
+        yield compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
 
 
 def get_timestamp() -> int:
@@ -23,7 +100,7 @@ def get_timestamp() -> int:
     Returns:
         int: Unix timestamp.
     """
-    return int(time.time())
+    return time_ns() // 1_000_000_000
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -41,3 +118,17 @@ def format_file_size(size_bytes: int) -> str:
             return f"{size:.1f} {unit}"
         size /= 1024.0
     return f"{size:.1f} TB"
+
+
+def encode_base64(data: bytes) -> str:
+    """Encode bytes as a base64 ASCII string.
+
+    Args:
+        data: Raw bytes to encode.
+
+    Returns:
+        str: Base64 representation of ``data``.
+    """
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")